@@ -0,0 +1,62 @@
+"""add sort indexes to properties
+
+Revision ID: 5c0e9b2d7a41
+Revises: eae3d4783ee0
+Create Date: 2026-10-18 13:40:12.904316
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c0e9b2d7a41'
+down_revision: Union[str, Sequence[str], None] = 'eae3d4783ee0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Keep in sync with PRICE_PER_SQM_SQL / sort_key() in app/models/property.py
+PRICE_PER_SQM_SQL = "price_base / NULLIF(area_sqm, 0)"
+
+SORT_COLUMNS = {
+    'price': 'price_base',
+    'area': 'area_sqm',
+    'price_per_sqm': 'price_per_sqm',
+}
+
+
+def _sort_indexes():
+    for name, column in SORT_COLUMNS.items():
+        yield f'ix_properties_owner_{name}_sort_asc', f"coalesce({column}, 'Infinity'::float8)"
+        yield f'ix_properties_owner_{name}_sort_desc', f"coalesce({column}, '-Infinity'::float8)"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # generated columns are computed after BEFORE triggers, so this follows price_base
+    op.add_column(
+        'properties',
+        sa.Column('price_per_sqm', sa.Float(), sa.Computed(PRICE_PER_SQM_SQL, persisted=True), nullable=True),
+    )
+
+    with op.get_context().autocommit_block():
+        for name, expression in _sort_indexes():
+            op.create_index(
+                name,
+                'properties',
+                ['owner_id', sa.text(expression), 'id'],
+                unique=False,
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, _ in reversed(list(_sort_indexes())):
+            op.drop_index(name, table_name='properties', postgresql_concurrently=True)
+
+    op.drop_column('properties', 'price_per_sqm')
@@ -0,0 +1,81 @@
+"""add price_base and exchange_rates
+
+Revision ID: a1e21ac17033
+Revises: ccb376e04631
+Create Date: 2026-10-18 12:31:05.117342
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a1e21ac17033'
+down_revision: Union[str, Sequence[str], None] = 'ccb376e04631'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# price in BASE_CURRENCY; no currency = already base, unknown currency = NULL
+PRICE_BASE_SQL = """
+    CASE
+        WHEN {row}.currency IS NULL THEN {row}.price
+        ELSE {row}.price * (
+            SELECT r.rate_to_base FROM exchange_rates r WHERE r.currency = upper({row}.currency)
+        )
+    END
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('exchange_rates',
+    sa.Column('currency', sa.String(length=10), nullable=False),
+    sa.Column('rate_to_base', sa.Float(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('currency')
+    )
+    # default BASE_CURRENCY; load real rates with `python load_exchange_rates.py rates.csv`
+    op.execute("INSERT INTO exchange_rates (currency, rate_to_base) VALUES ('GEL', 1.0)")
+
+    op.add_column('properties', sa.Column('price_base', sa.Float(), nullable=True))
+
+    op.execute(f"""
+        CREATE FUNCTION properties_set_price_base() RETURNS trigger AS $$
+        BEGIN
+            NEW.price_base := {PRICE_BASE_SQL.format(row='NEW')};
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_properties_price_base
+        BEFORE INSERT OR UPDATE OF price, currency ON properties
+        FOR EACH ROW EXECUTE FUNCTION properties_set_price_base()
+    """)
+    op.execute(f"UPDATE properties SET price_base = {PRICE_BASE_SQL.format(row='properties')}")
+
+    # price filters now run on price_base: swap the raw-price indexes for price_base ones
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_properties_owner_txn_price', table_name='properties', postgresql_concurrently=True)
+        op.drop_index('ix_properties_owner_currency_price', table_name='properties', postgresql_concurrently=True)
+        op.create_index('ix_properties_owner_price_base', 'properties', ['owner_id', 'price_base'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_properties_owner_txn_price_base', 'properties', ['owner_id', 'transaction_type', 'price_base'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_properties_owner_currency_price_base', 'properties', ['owner_id', 'currency', 'price_base'], unique=False, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_properties_owner_currency_price_base', table_name='properties', postgresql_concurrently=True)
+        op.drop_index('ix_properties_owner_txn_price_base', table_name='properties', postgresql_concurrently=True)
+        op.drop_index('ix_properties_owner_price_base', table_name='properties', postgresql_concurrently=True)
+        op.create_index('ix_properties_owner_currency_price', 'properties', ['owner_id', 'currency', 'price'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_properties_owner_txn_price', 'properties', ['owner_id', 'transaction_type', 'price'], unique=False, postgresql_concurrently=True)
+
+    op.execute("DROP TRIGGER trg_properties_price_base ON properties")
+    op.execute("DROP FUNCTION properties_set_price_base()")
+    op.drop_column('properties', 'price_base')
+    op.drop_table('exchange_rates')
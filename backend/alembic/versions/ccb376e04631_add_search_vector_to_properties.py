@@ -0,0 +1,71 @@
+"""add search vector to properties
+
+Revision ID: ccb376e04631
+Revises: f9d7c67030bc
+Create Date: 2026-10-18 11:02:17.840133
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'ccb376e04631'
+down_revision: Union[str, Sequence[str], None] = 'f9d7c67030bc'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Keep in sync with SEARCH_VECTOR_SQL in app/models/property.py
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('wisekey', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('wisekey', "
+    "coalesce(city, '') || ' ' || coalesce(district, '') || ' ' || coalesce(street, '')), 'B') || "
+    "setweight(to_tsvector('wisekey', coalesce(description, '')), 'C')"
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # english config for ASCII words; Georgian (non-ASCII) words go through "simple",
+    # which only lowercases, since Postgres ships no Georgian stemmer
+    op.execute("CREATE TEXT SEARCH CONFIGURATION wisekey (COPY = english)")
+    op.execute("ALTER TEXT SEARCH CONFIGURATION wisekey ALTER MAPPING FOR word, hword, hword_part WITH simple")
+
+    op.add_column(
+        'properties',
+        sa.Column(
+            'search_vector',
+            postgresql.TSVECTOR(),
+            sa.Computed(SEARCH_VECTOR_SQL, persisted=True),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        'ix_properties_search_vector',
+        'properties',
+        ['search_vector'],
+        unique=False,
+        postgresql_using='gin',
+    )
+
+    # ?q= now matches search_vector; nothing reads the title trigram index any more
+    op.drop_index('ix_properties_title_trgm', table_name='properties', postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(
+        'ix_properties_title_trgm',
+        'properties',
+        ['title'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'title': 'gin_trgm_ops'},
+    )
+    op.drop_index('ix_properties_search_vector', table_name='properties', postgresql_using='gin')
+    op.drop_column('properties', 'search_vector')
+    op.execute("DROP TEXT SEARCH CONFIGURATION wisekey")
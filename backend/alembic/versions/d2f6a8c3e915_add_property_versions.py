@@ -0,0 +1,75 @@
+"""add property versions
+
+Revision ID: d2f6a8c3e915
+Revises: 5c0e9b2d7a41
+Create Date: 2026-10-18 14:08:55.127604
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2f6a8c3e915'
+down_revision: Union[str, Sequence[str], None] = '5c0e9b2d7a41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# the writing transaction id never repeats, so a version can't come back after a rollback or re-migration
+BUMP_SQL = """
+    INSERT INTO property_versions (owner_id, version)
+    SELECT DISTINCT owner_id, txid_current() FROM {rows}
+    ON CONFLICT (owner_id) DO UPDATE SET version = EXCLUDED.version
+"""
+
+TRIGGERS = {
+    'trg_properties_version_insert': ('INSERT', 'REFERENCING NEW TABLE AS new_rows'),
+    'trg_properties_version_update': ('UPDATE', 'REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows'),
+    'trg_properties_version_delete': ('DELETE', 'REFERENCING OLD TABLE AS old_rows'),
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('property_versions',
+    sa.Column('owner_id', sa.Integer(), nullable=False),
+    sa.Column('version', sa.BigInteger(), nullable=False),
+    sa.ForeignKeyConstraint(['owner_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('owner_id')
+    )
+
+    # statement-level: one upsert per owner per statement, also for bulk inserts
+    # and recompute_price_base(); an UPDATE may move rows between owners
+    op.execute(f"""
+        CREATE FUNCTION properties_bump_version() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                {BUMP_SQL.format(rows='new_rows')};
+            ELSIF TG_OP = 'UPDATE' THEN
+                {BUMP_SQL.format(rows='(SELECT owner_id FROM old_rows UNION SELECT owner_id FROM new_rows) AS changed')};
+            ELSE
+                {BUMP_SQL.format(rows='old_rows')};
+            END IF;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+    """)
+    for name, (event, referencing) in TRIGGERS.items():
+        op.execute(f"""
+            CREATE TRIGGER {name}
+            AFTER {event} ON properties {referencing}
+            FOR EACH STATEMENT EXECUTE FUNCTION properties_bump_version()
+        """)
+
+    op.execute(BUMP_SQL.format(rows='properties'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name in reversed(list(TRIGGERS)):
+        op.execute(f"DROP TRIGGER {name} ON properties")
+    op.execute("DROP FUNCTION properties_bump_version()")
+    op.drop_table('property_versions')
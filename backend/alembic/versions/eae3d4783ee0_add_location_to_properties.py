@@ -0,0 +1,48 @@
+"""add location to properties
+
+Revision ID: eae3d4783ee0
+Revises: a1e21ac17033
+Create Date: 2026-10-18 13:02:47.381920
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'eae3d4783ee0'
+down_revision: Union[str, Sequence[str], None] = 'a1e21ac17033'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('properties', sa.Column('lat', sa.Float(), nullable=True))
+    op.add_column('properties', sa.Column('lon', sa.Float(), nullable=True))
+    op.create_check_constraint('ck_properties_lat_range', 'properties', 'lat BETWEEN -90 AND 90')
+    op.create_check_constraint('ck_properties_lon_range', 'properties', 'lon BETWEEN -180 AND 180')
+
+    # built-in GiST point index (no PostGIS needed): serves `point(lon, lat) <@ box`
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_properties_location',
+            'properties',
+            [sa.text('point(lon, lat)')],
+            unique=False,
+            postgresql_using='gist',
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_properties_location', table_name='properties', postgresql_concurrently=True)
+
+    op.drop_constraint('ck_properties_lon_range', 'properties', type_='check')
+    op.drop_constraint('ck_properties_lat_range', 'properties', type_='check')
+    op.drop_column('properties', 'lon')
+    op.drop_column('properties', 'lat')
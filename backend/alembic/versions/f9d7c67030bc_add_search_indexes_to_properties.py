@@ -0,0 +1,61 @@
+"""add search indexes to properties
+
+Revision ID: f9d7c67030bc
+Revises: 73a4f4e0a099
+Create Date: 2026-10-18 10:12:41.503218
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f9d7c67030bc'
+down_revision: Union[str, Sequence[str], None] = '73a4f4e0a099'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+BTREE_INDEXES = {
+    'ix_properties_owner_id_id': ['owner_id', 'id'],
+    'ix_properties_owner_txn_price': ['owner_id', 'transaction_type', 'price'],
+    'ix_properties_owner_currency_price': ['owner_id', 'currency', 'price'],
+    'ix_properties_owner_txn_rooms': ['owner_id', 'transaction_type', 'rooms'],
+    'ix_properties_owner_area': ['owner_id', 'area_sqm'],
+    'ix_properties_owner_comfort': ['owner_id', 'has_balcony', 'has_air_conditioning', 'pets_allowed'],
+}
+
+TRGM_COLUMNS = ['city', 'district', 'street', 'title']
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    # CONCURRENTLY so large tables stay writable while the indexes build
+    with op.get_context().autocommit_block():
+        for name, columns in BTREE_INDEXES.items():
+            op.create_index(name, 'properties', columns, unique=False, postgresql_concurrently=True)
+
+        for col in TRGM_COLUMNS:
+            op.create_index(
+                f'ix_properties_{col}_trgm',
+                'properties',
+                [col],
+                unique=False,
+                postgresql_using='gin',
+                postgresql_ops={col: 'gin_trgm_ops'},
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for col in reversed(TRGM_COLUMNS):
+            op.drop_index(f'ix_properties_{col}_trgm', table_name='properties', postgresql_concurrently=True)
+
+        for name in reversed(list(BTREE_INDEXES)):
+            op.drop_index(name, table_name='properties', postgresql_concurrently=True)
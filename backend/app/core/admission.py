@@ -0,0 +1,69 @@
+import asyncio
+
+from .config import MAX_CONCURRENT_REQUESTS, ADMISSION_QUEUE_SIZE, ADMISSION_QUEUE_TIMEOUT
+from .metrics import Counter, Gauge
+from .rate_limit import send_error, route_cost
+
+ADMISSION_IN_FLIGHT = Gauge("wisekey_admission_in_flight", "requests being handled (admission control slots in use)")
+ADMISSION_QUEUE_DEPTH = Gauge("wisekey_admission_queue_depth", "requests waiting for a slot")
+ADMISSION_REJECTED = Counter(
+    "wisekey_admission_rejected_total",
+    "requests shed with 503 (queue_full = no room to wait, timeout = waited ADMISSION_QUEUE_TIMEOUT)",
+    labelnames=("reason",),
+)
+
+
+class AdmissionMiddleware:
+    """
+    Pure ASGI concurrency limiter: at most `max_concurrent` requests run at once per worker,
+    up to `queue_size` more wait up to `timeout` seconds, the rest get 503 + Retry-After.
+    Shedding here is cheap, unlike requests piling up on the DB pool until DB_POOL_TIMEOUT.
+    Free routes (cost 0: /health, /metrics) are never queued.
+    """
+
+    def __init__(
+        self,
+        app,
+        max_concurrent: int = MAX_CONCURRENT_REQUESTS,
+        queue_size: int = ADMISSION_QUEUE_SIZE,
+        timeout: float = ADMISSION_QUEUE_TIMEOUT,
+    ):
+        self.app = app
+        self.slots = asyncio.Semaphore(max_concurrent)
+        self.queue_size = queue_size
+        self.timeout = timeout
+        self.waiting = 0
+
+    async def _reject(self, send, reason: str) -> None:
+        ADMISSION_REJECTED.inc(reason=reason)
+        await send_error(send, 503, "Server busy, try again later", [(b"retry-after", b"1")])
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or route_cost(scope["path"]) == 0:
+            await self.app(scope, receive, send)
+            return
+
+        if self.slots.locked():
+            if self.waiting >= self.queue_size:
+                await self._reject(send, "queue_full")
+                return
+
+            self.waiting += 1
+            ADMISSION_QUEUE_DEPTH.inc()
+            try:
+                await asyncio.wait_for(self.slots.acquire(), self.timeout)
+            except asyncio.TimeoutError:
+                await self._reject(send, "timeout")
+                return
+            finally:
+                self.waiting -= 1
+                ADMISSION_QUEUE_DEPTH.dec()
+        else:
+            await self.slots.acquire()
+
+        ADMISSION_IN_FLIGHT.inc()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            ADMISSION_IN_FLIGHT.dec()
+            self.slots.release()
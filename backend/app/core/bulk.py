@@ -0,0 +1,127 @@
+import codecs
+import csv
+import json
+from typing import AsyncIterator
+
+from .config import BULK_MAX_RECORD_CHARS
+
+
+class BulkRowError(ValueError):
+    """A single input row could not be parsed; the import continues with the next row."""
+
+
+async def iter_lines(stream: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """Split a byte stream into text lines without ever holding the whole body."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    buf = ""
+    async for chunk in stream:
+        buf += decoder.decode(chunk)
+        *lines, buf = buf.split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+
+    buf += decoder.decode(b"", final=True)
+    if buf:
+        yield buf.rstrip("\r")
+
+
+async def iter_ndjson(stream: AsyncIterator[bytes]) -> AsyncIterator[tuple[int, dict | BulkRowError]]:
+    """Yield (line_no, object) per NDJSON line; malformed lines yield a BulkRowError instead."""
+    line_no = 0
+    async for line in iter_lines(stream):
+        line_no += 1
+        if not line.strip():
+            continue
+        try:
+            obj = json.loads(line)
+        except ValueError as e:
+            yield line_no, BulkRowError(f"invalid JSON: {e}")
+            continue
+        if not isinstance(obj, dict):
+            yield line_no, BulkRowError("expected a JSON object")
+            continue
+        yield line_no, obj
+
+
+def _ends_in_quotes(line: str, in_quotes: bool) -> bool:
+    """
+    True when `line` ends inside a quoted field, i.e. the record goes on after the newline.
+    Same rules as csv.reader's default dialect: a '"' opens a quoted field only as the first
+    character of a field, '""' inside one is an escaped quote, anywhere else '"' is literal.
+    """
+    if not in_quotes and '"' not in line:
+        return False
+
+    field_start = not in_quotes
+    i, n = 0, len(line)
+    while i < n:
+        c = line[i]
+        if in_quotes:
+            if c == '"':
+                if i + 1 < n and line[i + 1] == '"':
+                    i += 2
+                    continue
+                in_quotes = False
+        elif c == ",":
+            field_start = True
+            i += 1
+            continue
+        elif c == '"' and field_start:
+            in_quotes = True
+        field_start = False
+        i += 1
+    return in_quotes
+
+
+async def iter_csv(
+    stream: AsyncIterator[bytes], max_record_chars: int = BULK_MAX_RECORD_CHARS
+) -> AsyncIterator[tuple[int, dict | BulkRowError]]:
+    """
+    Yield (row_no, dict) per CSV record, keyed by the header row. Empty cells become None.
+    Quoted fields may span lines; a quoted field still open after max_record_chars ends
+    the import (nothing after it can be split into records reliably).
+    """
+    header = None
+    row_no = 0
+    pending: list[str] = []
+    pending_chars = 0
+    in_quotes = False
+
+    async for line in iter_lines(stream):
+        pending.append(line)
+        pending_chars += len(line) + 1
+        in_quotes = _ends_in_quotes(line, in_quotes)
+        if in_quotes:
+            if pending_chars > max_record_chars:
+                yield row_no + 1, BulkRowError(
+                    f"quoted field longer than {max_record_chars} characters (unterminated quote?); "
+                    "rest of the input skipped"
+                )
+                return
+            continue
+
+        try:
+            record = next(csv.reader(["\n".join(pending)]), [])
+        except csv.Error as e:
+            row_no += 1
+            yield row_no, BulkRowError(f"invalid CSV: {e}")
+            continue
+        finally:
+            pending = []
+            pending_chars = 0
+
+        if not record:
+            continue
+
+        if header is None:
+            header = [h.strip() for h in record]
+            continue
+
+        row_no += 1
+        if len(record) != len(header):
+            yield row_no, BulkRowError(f"expected {len(header)} columns, got {len(record)}")
+            continue
+        yield row_no, {k: (v if v != "" else None) for k, v in zip(header, record)}
+
+    if pending:
+        yield row_no + 1, BulkRowError("unterminated quoted field")
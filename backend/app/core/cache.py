@@ -0,0 +1,119 @@
+import json
+import time
+from collections import OrderedDict
+from typing import Any
+
+from .config import REDIS_URL
+
+
+class TTLCache:
+    """In-process LRU cache with a per-entry TTL (single event loop, no locking needed)."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Any, tuple[float, Any]] = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key, default=None):
+        item = self._data.get(key)
+        if item is None:
+            self.misses += 1
+            return default
+
+        expires_at, value = item
+        if expires_at < time.monotonic():
+            del self._data[key]
+            self.misses += 1
+            return default
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key, value, ttl: float | None = None) -> None:
+        self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+        self._data.move_to_end(key)
+
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def delete(self, key) -> None:
+        self._data.pop(key, None)
+
+    def delete_matching(self, predicate) -> int:
+        """Drop every key for which predicate(key) is true; returns how many were dropped."""
+        keys = [k for k in self._data if predicate(k)]
+        for k in keys:
+            del self._data[k]
+        return len(keys)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
+class MemoryBackend:
+    """Async key/value backend on top of TTLCache (per process)."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.cache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    async def get(self, key: str):
+        return self.cache.get(key)
+
+    async def set(self, key: str, value, ttl: float | None = None) -> None:
+        self.cache.set(key, value, ttl)
+
+    async def delete(self, key: str) -> None:
+        self.cache.delete(key)
+
+
+class RedisBackend:
+    """
+    Async key/value backend for any redis.asyncio-compatible client
+    (redis-py, fakeredis.aioredis, ...). Values are stored as JSON.
+    """
+
+    def __init__(self, client, prefix: str, ttl: float):
+        self.client = client
+        self.prefix = prefix
+        self.ttl = ttl
+
+    async def get(self, key: str):
+        raw = await self.client.get(self.prefix + key)
+        return None if raw is None else json.loads(raw)
+
+    async def set(self, key: str, value, ttl: float | None = None) -> None:
+        ttl_ms = int((self.ttl if ttl is None else ttl) * 1000)
+        await self.client.set(self.prefix + key, json.dumps(value), px=ttl_ms)
+
+    async def delete(self, key: str) -> None:
+        await self.client.delete(self.prefix + key)
+
+
+_redis = None
+
+
+def get_redis():
+    """Shared redis client when REDIS_URL is configured, otherwise None."""
+    global _redis
+    if _redis is None and REDIS_URL:
+        try:
+            import redis.asyncio as redis
+        except ImportError:
+            raise RuntimeError("REDIS_URL is set but the 'redis' package is not installed")
+        _redis = redis.from_url(REDIS_URL)
+    return _redis
+
+
+def set_redis(client) -> None:
+    """Plug in a redis-compatible client explicitly (e.g. fakeredis in tests)."""
+    global _redis
+    _redis = client
@@ -1,8 +1,120 @@
 import os
 
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+def _env_bool(name: str, default: str) -> bool:
+    return os.getenv(name, default).strip().lower() in ("1", "true", "yes", "on")
+
+
 ENV = os.getenv("ENV", "dev")
 JWT_SECRET = os.getenv("JWT_SECRET", "change-me")
-JWT_ALG = os.getenv("JWT_ALG", "HS256")
+JWT_ALG = os.getenv("JWT_ALG", "HS256")  # HS256 (JWT_SECRET) or RS256 / ES256 (key files below)
+# Asymmetric algorithms: tokens are signed with this PEM private key and carry JWT_KID; other
+# services verify them with the public keys from GET /.well-known/jwks.json, no secret shared.
+#   openssl ecparam -name prime256v1 -genkey -noout | openssl pkcs8 -topk8 -nocrypt -out jwt-es256.pem
+JWT_PRIVATE_KEY_FILE = os.getenv("JWT_PRIVATE_KEY_FILE", "")
+JWT_KID = os.getenv("JWT_KID", "")
+# Optional JWKS file ({"keys": [...]}) of every public key still accepted, e.g. the previous key
+# during a rotation; re-read when it changes. Default: just the public half of JWT_PRIVATE_KEY_FILE.
+JWT_JWKS_FILE = os.getenv("JWT_JWKS_FILE", "")
+JWT_JWKS_RELOAD_SECONDS = float(os.getenv("JWT_JWKS_RELOAD_SECONDS", "30"))
+# verified access tokens kept per worker (until they expire), so repeat requests skip the signature check
+JWT_VERIFY_CACHE_SIZE = int(os.getenv("JWT_VERIFY_CACHE_SIZE", "10000"))
 ACCESS_TOKEN_MINUTES = int(os.getenv("ACCESS_TOKEN_MINUTES", "15"))
 REFRESH_TOKEN_DAYS = int(os.getenv("REFRESH_TOKEN_DAYS", "14"))
 
+
+# Pagination (opt-in: ?limit=...&cursor=...)
+MAX_PAGE_SIZE = int(os.getenv("MAX_PAGE_SIZE", "500"))
+
+# Optional Redis-compatible server shared by all workers (caches, etc.)
+REDIS_URL = os.getenv("REDIS_URL", "")
+
+# Authenticated-user cache used by get_current_user
+USER_CACHE_TTL_SECONDS = int(os.getenv("USER_CACHE_TTL_SECONDS", "60"))
+USER_CACHE_MAX_ENTRIES = int(os.getenv("USER_CACHE_MAX_ENTRIES", "10000"))
+
+# /properties/search result cache: in-process LRU, plus Redis when REDIS_URL is set
+SEARCH_CACHE_TTL_SECONDS = int(os.getenv("SEARCH_CACHE_TTL_SECONDS", "300"))
+SEARCH_CACHE_MAX_ENTRIES = int(os.getenv("SEARCH_CACHE_MAX_ENTRIES", "1000"))
+# larger pages (e.g. a whole portfolio without ?limit=) are not cached in either tier
+SEARCH_CACHE_MAX_BODY_BYTES = int(os.getenv("SEARCH_CACHE_MAX_BODY_BYTES", "262144"))
+SEARCH_CACHE_REDIS = _env_bool("SEARCH_CACHE_REDIS", "true")
+
+# /properties/search/count and ?total=: capped counts stop here, estimates above it are not re-counted
+SEARCH_COUNT_CAP = int(os.getenv("SEARCH_COUNT_CAP", "10000"))
+
+# Bulk import (POST /properties/bulk)
+BULK_BATCH_SIZE = int(os.getenv("BULK_BATCH_SIZE", "1000"))
+BULK_MAX_ERRORS = int(os.getenv("BULK_MAX_ERRORS", "1000"))
+# longest CSV record (quoted fields may span lines) held while looking for its end
+BULK_MAX_RECORD_CHARS = int(os.getenv("BULK_MAX_RECORD_CHARS", "1000000"))
+
+# PATCH / DELETE /properties/batch: max ids per request (one statement each)
+BATCH_MAX_IDS = int(os.getenv("BATCH_MAX_IDS", "1000"))
+
+# Streaming export (GET /properties/export): rows fetched per server-side cursor round trip
+EXPORT_CHUNK_SIZE = int(os.getenv("EXPORT_CHUNK_SIZE", "1000"))
+
+# Password hashing (bcrypt runs off the event loop in a bounded pool)
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+BCRYPT_POOL = os.getenv("BCRYPT_POOL", "thread")  # thread / process
+BCRYPT_WORKERS = int(os.getenv("BCRYPT_WORKERS", str(min(4, os.cpu_count() or 1))))
+BCRYPT_MAX_QUEUE = int(os.getenv("BCRYPT_MAX_QUEUE", "100"))  # waiting hashes before 503
+
+# Database engine / connection pool (one engine per database URL, see app/db/session.py)
+DATABASE_URL = os.getenv("DATABASE_URL")
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))  # seconds, -1 = never
+DB_POOL_PRE_PING = _env_bool("DB_POOL_PRE_PING", "true")
+DB_STATEMENT_CACHE_SIZE = int(os.getenv("DB_STATEMENT_CACHE_SIZE", "100"))  # asyncpg prepared statements
+# PgBouncer (transaction/statement pooling) can't keep prepared statements per connection
+DB_PGBOUNCER = _env_bool("DB_PGBOUNCER", "false")
+
+# GET /metrics is served only to these client IPs (comma-separated; empty = none) or to
+# "Authorization: Bearer <METRICS_TOKEN>" when a token is set. Behind a proxy run uvicorn
+# with --proxy-headers so the client IP is the real one.
+METRICS_ALLOW_IPS = {ip.strip() for ip in os.getenv("METRICS_ALLOW_IPS", "127.0.0.1,::1").split(",") if ip.strip()}
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
+
+# log statements slower than this (compiled SQL + parameter types) to the "wisekey.sql" logger; 0 = off
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", "0"))
+
+# Read replicas for GET endpoints (comma-separated URLs; empty = everything on the primary)
+DATABASE_REPLICA_URLS = [u.strip() for u in os.getenv("DATABASE_REPLICA_URLS", "").split(",") if u.strip()]
+DB_REPLICA_STRATEGY = os.getenv("DB_REPLICA_STRATEGY", "round_robin")  # round_robin / least_connections
+# after a user writes, their reads stay on the primary this long (covers replica lag)
+READ_YOUR_WRITES_SECONDS = float(os.getenv("READ_YOUR_WRITES_SECONDS", "5"))
+# the "just wrote" markers must be seen by every worker, so replicas require REDIS_URL;
+# true = keep them per process instead (only correct with a single worker)
+READ_YOUR_WRITES_LOCAL = _env_bool("READ_YOUR_WRITES_LOCAL", "false")
+
+# Rate limiting (token buckets, app/core/rate_limit.py): each request spends its route's cost
+# from the client IP's bucket and, with a valid access token, from the user's bucket.
+# rate = tokens refilled per second, burst = bucket size. Behind a proxy run uvicorn with
+# --proxy-headers so the client IP is the real one.
+RATE_LIMIT_ENABLED = _env_bool("RATE_LIMIT_ENABLED", "true")
+RATE_LIMIT_USER_RATE = float(os.getenv("RATE_LIMIT_USER_RATE", "10"))
+RATE_LIMIT_USER_BURST = float(os.getenv("RATE_LIMIT_USER_BURST", "60"))
+RATE_LIMIT_IP_RATE = float(os.getenv("RATE_LIMIT_IP_RATE", "20"))
+RATE_LIMIT_IP_BURST = float(os.getenv("RATE_LIMIT_IP_BURST", "120"))
+RATE_LIMIT_REDIS = _env_bool("RATE_LIMIT_REDIS", "true")  # share buckets across workers when REDIS_URL is set
+RATE_LIMIT_MAX_KEYS = int(os.getenv("RATE_LIMIT_MAX_KEYS", "100000"))  # in-process buckets kept
+
+# Admission control (app/core/admission.py): requests handled at once per worker; more wait
+# in a bounded queue, and get 503 when it is full or the wait times out. The default matches
+# the primary DB pool so requests queue here instead of inside the pool.
+MAX_CONCURRENT_REQUESTS = int(os.getenv("MAX_CONCURRENT_REQUESTS", str(DB_POOL_SIZE + DB_MAX_OVERFLOW)))
+ADMISSION_QUEUE_SIZE = int(os.getenv("ADMISSION_QUEUE_SIZE", "100"))
+ADMISSION_QUEUE_TIMEOUT = float(os.getenv("ADMISSION_QUEUE_TIMEOUT", "5"))  # seconds
+
+# Currency all prices are normalized to (Property.price_base, see load_exchange_rates.py)
+BASE_CURRENCY = os.getenv("BASE_CURRENCY", "GEL").upper()
+
+# Conditional GETs on property reads (ETag / If-None-Match); "no-cache" = revalidate every time
+PROPERTY_CACHE_CONTROL = os.getenv("PROPERTY_CACHE_CONTROL", "private, no-cache")
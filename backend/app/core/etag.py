@@ -0,0 +1,42 @@
+from fastapi import Request, Response
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.exchange_rate import ExchangeRate
+from app.models.property_version import PropertyVersion
+
+from .config import PROPERTY_CACHE_CONTROL
+
+
+async def properties_etag(db: AsyncSession, owner_id: int, with_rates: bool = False) -> str:
+    """
+    Weak ETag for any read of the owner's properties: one primary-key lookup instead of
+    loading rows. `with_rates` also covers exchange-rate changes (currency-converted filters).
+    Read it from the same session as the rows so replica reads stay consistent.
+    """
+    columns = [select(PropertyVersion.version).where(PropertyVersion.owner_id == owner_id).scalar_subquery()]
+    if with_rates:
+        columns.append(select(func.extract("epoch", func.max(ExchangeRate.updated_at))).scalar_subquery())
+
+    version, *rates = (await db.execute(select(*columns))).one()
+    parts = [owner_id, version or 0] + [f"r{r or 0}" for r in rates]
+    return 'W/"' + ".".join(str(p) for p in parts) + '"'
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    # If-None-Match uses weak comparison: W/"x" and "x" match
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
+def not_modified(request: Request, response: Response, etag: str) -> Response | None:
+    """Set ETag / Cache-Control on `response`; return a 304 to send instead when the client is current."""
+    headers = {"ETag": etag, "Cache-Control": PROPERTY_CACHE_CONTROL}
+    response.headers.update(headers)
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return None
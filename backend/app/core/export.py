@@ -0,0 +1,95 @@
+import csv
+import io
+import json
+import typing
+from typing import AsyncIterator, Sequence
+
+# Each serializer consumes row partitions (lists of tuples in `fields` order)
+# and yields encoded chunks, so memory stays bounded by one partition.
+RowChunks = AsyncIterator[Sequence[tuple]]
+
+
+async def ndjson_chunks(partitions: RowChunks, fields: list[str]) -> AsyncIterator[bytes]:
+    async for rows in partitions:
+        lines = [json.dumps(dict(zip(fields, row)), ensure_ascii=False) for row in rows]
+        yield ("\n".join(lines) + "\n").encode("utf-8")
+
+
+async def csv_chunks(partitions: RowChunks, fields: list[str]) -> AsyncIterator[bytes]:
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(fields)
+
+    async for rows in partitions:
+        writer.writerows(rows)
+        yield buf.getvalue().encode("utf-8")
+        buf.seek(0)
+        buf.truncate()
+
+    if buf.tell():
+        yield buf.getvalue().encode("utf-8")
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file for ParquetWriter that hands written bytes back in chunks."""
+
+    def __init__(self):
+        self._chunks: list[bytes] = []
+        self._pos = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b) -> int:
+        data = bytes(b)
+        self._chunks.append(data)
+        self._pos += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        # parquet footer offsets are computed from tell(), so keep the absolute position
+        return self._pos
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _arrow_type(pa, annotation):
+    # Optional[X] -> X
+    args = [a for a in typing.get_args(annotation) if a is not type(None)]
+    tp = args[0] if args else annotation
+    return {str: pa.string(), int: pa.int64(), float: pa.float64(), bool: pa.bool_()}[tp]
+
+
+def parquet_available() -> bool:
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+async def parquet_chunks(partitions: RowChunks, fields: list[str], annotations: dict) -> AsyncIterator[bytes]:
+    """One parquet row group per partition; requires the optional pyarrow package."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.schema([(f, _arrow_type(pa, annotations[f])) for f in fields])
+    sink = _ChunkSink()
+    writer = pq.ParquetWriter(sink, schema)
+    try:
+        async for rows in partitions:
+            columns = list(zip(*rows)) if rows else [[] for _ in fields]
+            writer.write_table(pa.Table.from_arrays(
+                [pa.array(col, type=schema.field(i).type) for i, col in enumerate(columns)],
+                schema=schema,
+            ))
+            chunk = sink.drain()
+            if chunk:
+                yield chunk
+    finally:
+        writer.close()
+
+    yield sink.drain()
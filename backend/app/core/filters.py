@@ -0,0 +1,333 @@
+"""
+Declarative search filters: one table (PROPERTY_FILTERS) lists every filter with its
+operator, and generates the query parameters, the WHERE conditions and the index each
+predicate relies on. Any endpoint that depends on `search_filters` gets the same predicates.
+
+Conditions are written with bind parameters only (values travel in SearchFilters.params),
+so each combination of active filters builds its statement once; see _search_statement().
+"""
+import inspect
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Callable
+
+from fastapi import Query
+from sqlalchemy import ColumnElement, Table, bindparam, cast, func
+from sqlalchemy.dialects.postgresql import REGCONFIG
+
+from app.models.property import Property, SEARCH_TS_CONFIG
+
+from .config import BASE_CURRENCY
+from .fx import rate_to_base
+from .geo import boxes_params, parse_bbox, parse_point, radius_params, split_bbox, within_boxes, within_radius
+
+Predicate = Callable[[], ColumnElement | list[ColumnElement]]
+
+
+def _query_param(name: str, annotation, **query) -> inspect.Parameter:
+    return inspect.Parameter(
+        name, inspect.Parameter.KEYWORD_ONLY, annotation=annotation, default=Query(**{"default": None, **query})
+    )
+
+
+def _present(value) -> bool:
+    return value is not None and value != ""
+
+
+@dataclass(frozen=True)
+class Filter(ABC):
+    """
+    Base filter. Subclasses declare their query parameters, turn request values into
+    (predicate key, bind values) and map each predicate key to a condition builder.
+    `indexes` are the indexes the predicates are meant to use (checked against the table).
+    """
+    name: str
+    indexes: tuple[str, ...] = field(default=(), kw_only=True)
+    facet: bool = field(default=False, kw_only=True)  # also counted by /properties/facets
+
+    @abstractmethod
+    def query_params(self) -> list[inspect.Parameter]:
+        ...
+
+    @abstractmethod
+    def bind(self, values: dict, params: dict) -> list[str]:
+        ...
+
+    @abstractmethod
+    def predicates(self) -> dict[str, Predicate]:
+        ...
+
+
+@dataclass(frozen=True)
+class Eq(Filter):
+    """column = value"""
+    column: Any = None
+    type: type = str
+
+    def query_params(self):
+        return [_query_param(self.name, self.type | None)]
+
+    def bind(self, values, params):
+        if not _present(values[self.name]):
+            return []
+        params[self.name] = values[self.name]
+        return [self.name]
+
+    def predicates(self):
+        return {self.name: lambda: self.column == bindparam(self.name)}
+
+
+@dataclass(frozen=True)
+class Bool(Eq):
+    """column = true / false"""
+    type: type = bool
+
+
+@dataclass(frozen=True)
+class ILike(Filter):
+    """Case-insensitive substring match (pg_trgm GIN indexes make '%...%' indexable)."""
+    column: Any = None
+
+    def query_params(self):
+        return [_query_param(self.name, str | None)]
+
+    def bind(self, values, params):
+        if not _present(values[self.name]):
+            return []
+        params[self.name] = f"%{values[self.name]}%"
+        return [self.name]
+
+    def predicates(self):
+        return {self.name: lambda: self.column.ilike(bindparam(self.name))}
+
+
+@dataclass(frozen=True)
+class Range(Filter):
+    """min_<name> <= column <= max_<name>, either bound optional."""
+    column: Any = None
+    type: type = float
+    description: str | None = None
+
+    @property
+    def bounds(self) -> tuple[str, str]:
+        return f"min_{self.name}", f"max_{self.name}"
+
+    def query_params(self):
+        return [_query_param(p, self.type | None, description=self.description) for p in self.bounds]
+
+    def bind(self, values, params):
+        active = []
+        for p in self.bounds:
+            if values[p] is not None:
+                params[p] = values[p]
+                active.append(p)
+        return active
+
+    def predicates(self):
+        low, high = self.bounds
+        return {
+            low: lambda: self.column >= bindparam(low),
+            high: lambda: self.column <= bindparam(high),
+        }
+
+
+@dataclass(frozen=True)
+class CurrencyRange(Range):
+    """
+    Range on a column normalized to BASE_CURRENCY: bounds are in the `currency` filter's
+    currency when one is given, converted once inside the query, so a single indexed
+    range scan covers every currency.
+    """
+    currency: str = "currency"
+
+    def bind(self, values, params):
+        active = super().bind(values, params)
+        if _present(values[self.currency]):
+            return [f"{p}_in_currency" for p in active]
+        return active
+
+    def predicates(self):
+        predicates = super().predicates()
+        for p in self.bounds:
+            compare = self.column.__ge__ if p.startswith("min_") else self.column.__le__
+            predicates[f"{p}_in_currency"] = (
+                lambda p=p, compare=compare: compare(bindparam(p) * rate_to_base(bindparam(self.currency)))
+            )
+        return predicates
+
+
+@dataclass(frozen=True)
+class Near(Filter):
+    """`name`='lat,lon' plus radius_km: GiST bounding box pre-filter, then exact distance."""
+
+    def query_params(self):
+        return [
+            _query_param(
+                self.name, str | None, description="'lat,lon': only listings within radius_km of this point"
+            ),
+            inspect.Parameter(
+                "radius_km", inspect.Parameter.KEYWORD_ONLY, annotation=float,
+                default=Query(default=2, gt=0, le=500, allow_inf_nan=False),
+            ),
+        ]
+
+    def bind(self, values, params):
+        if not values[self.name]:
+            return []
+        lat, lon = parse_point(values[self.name], self.name)
+        count, near_params = radius_params(self.name, lat, lon, values["radius_km"])
+        params.update(near_params)
+        return [f"{self.name}:{count}"]
+
+    def predicates(self):
+        # the suffix is the number of boxes (2 when the area crosses ±180°)
+        return {f"{self.name}:{n}": lambda n=n: within_radius(self.name, n) for n in (1, 2)}
+
+
+@dataclass(frozen=True)
+class BBox(Filter):
+    """`name`='min_lon,min_lat,max_lon,max_lat'"""
+
+    def query_params(self):
+        return [_query_param(self.name, str | None, description="'min_lon,min_lat,max_lon,max_lat'")]
+
+    def bind(self, values, params):
+        if not values[self.name]:
+            return []
+        boxes = split_bbox(parse_bbox(values[self.name], self.name))
+        params.update(boxes_params(self.name, boxes))
+        return [f"{self.name}:{len(boxes)}"]
+
+    def predicates(self):
+        return {f"{self.name}:{n}": lambda n=n: within_boxes(self.name, n) for n in (1, 2)}
+
+
+SEARCH_TSQUERY = func.websearch_to_tsquery(cast(SEARCH_TS_CONFIG, REGCONFIG), bindparam("q"))
+
+
+@dataclass(frozen=True)
+class FullText(Filter):
+    """websearch syntax against the generated search_vector column."""
+
+    def query_params(self):
+        return [_query_param(
+            self.name, str | None,
+            description="full-text search in title, description and address (websearch syntax), ranked by relevance",
+        )]
+
+    def bind(self, values, params):
+        if not _present(values[self.name]):
+            return []
+        params[self.name] = values[self.name]
+        return [self.name]
+
+    def predicates(self):
+        return {self.name: lambda: Property.search_vector.op("@@")(SEARCH_TSQUERY)}
+
+
+@dataclass
+class SearchFilters:
+    """
+    Active search filters (owner scope not included): `signature` names the predicates,
+    `params` holds their bind values. Execute statements using `conditions` with `params`.
+    """
+    signature: tuple[str, ...]
+    params: dict
+    conditions: list[ColumnElement]
+
+    @property
+    def tsquery(self) -> ColumnElement | None:
+        return SEARCH_TSQUERY if "q" in self.signature else None
+
+
+class FilterSet:
+    def __init__(self, filters: list[Filter]):
+        self.filters = filters
+        self._predicates: dict[str, Predicate] = {}
+        for f in filters:
+            self._predicates.update(f.predicates())
+        self.conditions = lru_cache(maxsize=1024)(self._conditions)
+
+    def _conditions(self, signature: tuple[str, ...]) -> list[ColumnElement]:
+        conditions = []
+        for key in signature:
+            condition = self._predicates[key]()
+            conditions.extend(condition if isinstance(condition, list) else [condition])
+        return conditions
+
+    def parse(self, values: dict) -> SearchFilters:
+        params: dict = {}
+        signature = tuple(key for f in self.filters for key in f.bind(values, params))
+        return SearchFilters(signature=signature, params=params, conditions=self.conditions(signature))
+
+    def dependency(self) -> Callable[..., SearchFilters]:
+        """FastAPI dependency taking every filter's query parameters."""
+        def dependency(**values) -> SearchFilters:
+            return self.parse(values)
+
+        dependency.__signature__ = inspect.Signature(
+            [p for f in self.filters for p in f.query_params()], return_annotation=SearchFilters
+        )
+        return dependency
+
+    @property
+    def facet_fields(self) -> tuple[str, ...]:
+        return tuple(f.name for f in self.filters if f.facet)
+
+    def index_hints(self) -> dict[str, tuple[str, ...]]:
+        return {f.name: f.indexes for f in self.filters if f.indexes}
+
+    def check_indexes(self, table: Table) -> None:
+        """Fail fast when an index a filter relies on is renamed or dropped from the model."""
+        names = {ix.name for ix in table.indexes}
+        missing = {ix for indexes in self.index_hints().values() for ix in indexes} - names
+        if missing:
+            raise RuntimeError(f"filter index hints not defined on {table.name}: {', '.join(sorted(missing))}")
+
+
+PROPERTY_FILTERS = FilterSet([
+    # Basic Filters
+    Eq("transaction_type", Property.transaction_type, facet=True, indexes=(
+        "ix_properties_owner_txn_price_base", "ix_properties_owner_txn_rooms",
+    )),
+    ILike("city", Property.city, facet=True, indexes=("ix_properties_city_trgm",)),
+    ILike("district", Property.district, facet=True, indexes=("ix_properties_district_trgm",)),
+    ILike("street", Property.street, indexes=("ix_properties_street_trgm",)),
+
+    Eq("currency", Property.currency, indexes=("ix_properties_owner_currency_price_base",)),
+    CurrencyRange(
+        "price", Property.price_base, description=f"in `currency` if given, else {BASE_CURRENCY}",
+        indexes=("ix_properties_owner_price_base",),
+    ),
+    Range("area", Property.area_sqm, indexes=("ix_properties_owner_area",)),
+
+    Eq("rooms", Property.rooms, int, indexes=("ix_properties_owner_txn_rooms",)),
+    Eq("bedrooms", Property.bedrooms, int),
+    Eq("bathrooms", Property.bathrooms, int),
+
+    Eq("floor", Property.floor, int),
+    Eq("total_floors", Property.total_floors, int),
+    Bool("not_first_floor", Property.not_first_floor),
+
+    Eq("condition", Property.condition, facet=True),
+
+    # Comfort / Infrastructure
+    Eq("building_type", Property.building_type, facet=True),
+    Eq("heating_type", Property.heating_type, facet=True),
+    Bool("has_air_conditioning", Property.has_air_conditioning, indexes=("ix_properties_owner_comfort",)),
+
+    Eq("parking_type", Property.parking_type, facet=True),
+    Bool("has_balcony", Property.has_balcony, indexes=("ix_properties_owner_comfort",)),
+    Bool("pets_allowed", Property.pets_allowed, indexes=("ix_properties_owner_comfort",)),
+    Eq("furnished", Property.furnished, facet=True),
+
+    # Location
+    Near("near", indexes=("ix_properties_location",)),
+    BBox("bbox", indexes=("ix_properties_location",)),
+
+    FullText("q", indexes=("ix_properties_search_vector",)),
+])
+PROPERTY_FILTERS.check_indexes(Property.__table__)
+
+search_filters = PROPERTY_FILTERS.dependency()
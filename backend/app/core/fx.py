@@ -0,0 +1,66 @@
+from sqlalchemy import select, update, func, and_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.exchange_rate import ExchangeRate
+from app.models.property import Property
+
+from .config import BASE_CURRENCY
+
+
+def rate_to_base(currency: str):
+    """Scalar subquery: rate of `currency` -> BASE_CURRENCY (evaluated once per query)."""
+    return (
+        select(ExchangeRate.rate_to_base)
+        .where(ExchangeRate.currency == func.upper(currency))
+        .scalar_subquery()
+    )
+
+
+async def upsert_rates(db: AsyncSession, rates: dict[str, float]) -> None:
+    rates = {c.upper(): float(r) for c, r in rates.items()}
+    rates[BASE_CURRENCY] = 1.0
+
+    stmt = pg_insert(ExchangeRate).values(
+        [{"currency": c, "rate_to_base": r} for c, r in rates.items()]
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[ExchangeRate.currency],
+        set_={"rate_to_base": stmt.excluded.rate_to_base, "updated_at": func.now()},
+    )
+    await db.execute(stmt)
+
+
+async def recompute_price_base(db: AsyncSession) -> int:
+    """
+    Bulk-refresh Property.price_base after rates change: two set-based UPDATEs
+    that only touch rows whose value actually changes. Returns rows updated.
+    (Inserts and price/currency edits are kept current by a trigger.)
+    """
+    new_value = Property.price * ExchangeRate.rate_to_base
+    converted = await db.execute(
+        update(Property)
+        .where(
+            func.upper(Property.currency) == ExchangeRate.currency,
+            Property.price_base.is_distinct_from(new_value),
+        )
+        .values(price_base=new_value)
+        .execution_options(synchronize_session=False)
+    )
+
+    # currencies that no longer have a rate can't be compared with the rest
+    unknown = await db.execute(
+        update(Property)
+        .where(
+            and_(
+                Property.currency.is_not(None),
+                Property.price_base.is_not(None),
+                ~select(ExchangeRate.currency)
+                .where(ExchangeRate.currency == func.upper(Property.currency))
+                .exists(),
+            )
+        )
+        .values(price_base=None)
+        .execution_options(synchronize_session=False)
+    )
+    return converted.rowcount + unknown.rowcount
@@ -0,0 +1,127 @@
+import math
+
+from fastapi import HTTPException
+from sqlalchemy import ColumnElement, Float, bindparam, func, or_
+
+from app.models.property import Property
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE_LAT = math.pi * EARTH_RADIUS_KM / 180
+
+BBox = tuple[float, float, float, float]  # min_lon, min_lat, max_lon, max_lat
+
+# Conditions are built from bind parameters only (values go in a params dict), so the
+# statement for a given filter shape can be built once and reused; see the Near / BBox
+# filters in app/core/filters.py and _search_statement() in app/routes/properties.py.
+
+
+def _floats(value: str, count: int, name: str, fmt: str) -> list[float]:
+    try:
+        parts = [float(p) for p in value.split(",")]
+    except ValueError:
+        parts = []
+    if len(parts) != count or not all(math.isfinite(p) for p in parts):
+        raise HTTPException(status_code=400, detail=f"Invalid {name}: expected '{fmt}'")
+    return parts
+
+
+def parse_point(value: str, name: str = "near") -> tuple[float, float]:
+    lat, lon = _floats(value, 2, name, "lat,lon")
+    if not (-90 <= lat <= 90 and -180 <= lon <= 180):
+        raise HTTPException(status_code=400, detail=f"Invalid {name}: lat/lon out of range")
+    return lat, lon
+
+
+def parse_bbox(value: str, name: str = "bbox") -> BBox:
+    min_lon, min_lat, max_lon, max_lat = _floats(value, 4, name, "min_lon,min_lat,max_lon,max_lat")
+    if not (-90 <= min_lat <= max_lat <= 90 and -180 <= min_lon <= 180 and -180 <= max_lon <= 180):
+        raise HTTPException(status_code=400, detail=f"Invalid {name}: coordinates out of range")
+    # min_lon > max_lon is a box crossing the antimeridian
+    return min_lon, min_lat, max_lon, max_lat
+
+
+def radius_bbox(lat: float, lon: float, radius_km: float) -> BBox:
+    """Smallest lon/lat box containing the circle; lon bounds may run past ±180."""
+    dlat = radius_km / KM_PER_DEGREE_LAT
+    min_lat, max_lat = lat - dlat, lat + dlat
+    if min_lat <= -90 or max_lat >= 90:
+        # circle covers a pole: every longitude is in range
+        return -180.0, max(min_lat, -90.0), 180.0, min(max_lat, 90.0)
+
+    dlon = math.degrees(math.asin(min(1.0, math.sin(radius_km / EARTH_RADIUS_KM) / math.cos(math.radians(lat)))))
+    if dlon >= 180:
+        return -180.0, min_lat, 180.0, max_lat
+    return lon - dlon, min_lat, lon + dlon, max_lat
+
+
+def split_bbox(bbox: BBox) -> list[BBox]:
+    """One box, or two when it crosses the antimeridian (every box within ±180)."""
+    min_lon, min_lat, max_lon, max_lat = bbox
+    if min_lon > max_lon:
+        return [(min_lon, min_lat, 180.0, max_lat), (-180.0, min_lat, max_lon, max_lat)]
+    if min_lon < -180:
+        return [(min_lon + 360, min_lat, 180.0, max_lat), (-180.0, min_lat, max_lon, max_lat)]
+    if max_lon > 180:
+        return [(min_lon, min_lat, 180.0, max_lat), (-180.0, min_lat, max_lon - 360, max_lat)]
+    return [bbox]
+
+
+def _p(name: str):
+    return bindparam(name, type_=Float)
+
+
+def within_boxes(prefix: str, count: int) -> ColumnElement:
+    """point(lon, lat) inside any of `count` boxes; same expression as ix_properties_location (GiST)."""
+    location = func.point(Property.lon, Property.lat)
+    boxes = [
+        location.op("<@")(func.box(
+            func.point(_p(f"{prefix}{i}_min_lon"), _p(f"{prefix}{i}_min_lat")),
+            func.point(_p(f"{prefix}{i}_max_lon"), _p(f"{prefix}{i}_max_lat")),
+        ))
+        for i in range(count)
+    ]
+    return boxes[0] if count == 1 else or_(*boxes)
+
+
+def boxes_params(prefix: str, boxes: list[BBox]) -> dict:
+    params = {}
+    for i, (min_lon, min_lat, max_lon, max_lat) in enumerate(boxes):
+        params.update({
+            f"{prefix}{i}_min_lon": min_lon,
+            f"{prefix}{i}_min_lat": min_lat,
+            f"{prefix}{i}_max_lon": max_lon,
+            f"{prefix}{i}_max_lat": max_lat,
+        })
+    return params
+
+
+def distance_km(lat, lon, cos_lat) -> ColumnElement:
+    """Great-circle (haversine) distance from (lat, lon) to each property; cos_lat = cos(radians(lat))."""
+    dlat = func.radians(Property.lat - lat) / 2
+    dlon = func.radians(Property.lon - lon) / 2
+    a = (
+        func.power(func.sin(dlat), 2)
+        + cos_lat * func.cos(func.radians(Property.lat)) * func.power(func.sin(dlon), 2)
+    )
+    return 2 * EARTH_RADIUS_KM * func.asin(func.least(1.0, func.sqrt(a)))
+
+
+def within_radius(prefix: str, count: int) -> list[ColumnElement]:
+    """Index-backed bounding box pre-filter (`count` boxes) plus the exact distance check."""
+    return [
+        within_boxes(prefix, count),
+        distance_km(_p(f"{prefix}_lat"), _p(f"{prefix}_lon"), _p(f"{prefix}_cos_lat")) <= _p(f"{prefix}_radius_km"),
+    ]
+
+
+def radius_params(prefix: str, lat: float, lon: float, radius_km: float) -> tuple[int, dict]:
+    """(box count, params) for within_radius(prefix, count)."""
+    boxes = split_bbox(radius_bbox(lat, lon, radius_km))
+    params = boxes_params(prefix, boxes)
+    params.update({
+        f"{prefix}_lat": lat,
+        f"{prefix}_lon": lon,
+        f"{prefix}_cos_lat": math.cos(math.radians(lat)),
+        f"{prefix}_radius_km": radius_km,
+    })
+    return len(boxes), params
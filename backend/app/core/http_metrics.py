@@ -0,0 +1,66 @@
+import time
+
+from app.db.instrumentation import track_request_db, untrack_request_db
+
+from .metrics import Counter, Histogram
+
+HTTP_REQUESTS = Counter(
+    "wisekey_http_requests_total",
+    "HTTP requests by route template and status code",
+    labelnames=("method", "route", "status"),
+)
+HTTP_REQUEST_SECONDS = Histogram(
+    "wisekey_http_request_duration_seconds",
+    "time from request start to the last body byte",
+    labelnames=("method", "route"),
+)
+HTTP_REQUEST_DB_QUERIES = Histogram(
+    "wisekey_http_request_db_queries",
+    "SQL statements sent per request",
+    labelnames=("method", "route"),
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100),
+)
+HTTP_REQUEST_DB_SECONDS = Histogram(
+    "wisekey_http_request_db_seconds",
+    "time spent executing SQL per request",
+    labelnames=("method", "route"),
+)
+
+
+class MetricsMiddleware:
+    """
+    Pure ASGI middleware (no BaseHTTPMiddleware task overhead): per-route latency,
+    status counts and DB query count / time. Routes are labelled by their path template
+    (/properties/{property_id}), unmatched paths as "unmatched" to keep label cardinality bounded.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        stats, token = track_request_db()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - start
+            untrack_request_db(token)
+
+            route = scope.get("route")
+            labels = {"method": scope["method"], "route": route.path if route is not None else "unmatched"}
+            HTTP_REQUESTS.inc(status=status, **labels)
+            HTTP_REQUEST_SECONDS.observe(elapsed, **labels)
+            HTTP_REQUEST_DB_QUERIES.observe(stats.queries, **labels)
+            HTTP_REQUEST_DB_SECONDS.observe(stats.seconds, **labels)
@@ -0,0 +1,101 @@
+"""
+Signing and verification keys for access tokens.
+
+HS256 (default) signs and verifies with JWT_SECRET. With RS256 / ES256 the API signs with
+JWT_PRIVATE_KEY_FILE and puts JWT_KID in the token header; verification picks the public
+key by kid from a local key set (JWT_JWKS_FILE, re-read when it changes), which is also
+published at /.well-known/jwks.json. Rotating a key:
+  1. add the new public key to JWT_JWKS_FILE (every verifier picks it up within JWT_JWKS_RELOAD_SECONDS)
+  2. restart the API with the new JWT_PRIVATE_KEY_FILE / JWT_KID
+  3. once ACCESS_TOKEN_MINUTES have passed, drop the old key from the file
+"""
+import json
+import os
+import time
+
+from jose import jwk
+
+from .config import JWT_SECRET, JWT_ALG, JWT_PRIVATE_KEY_FILE, JWT_KID, JWT_JWKS_FILE, JWT_JWKS_RELOAD_SECONDS
+
+ASYMMETRIC_ALGS = ("RS256", "RS384", "RS512", "ES256", "ES384", "ES512")
+
+
+class KeySet:
+    def __init__(
+        self,
+        alg: str = JWT_ALG,
+        secret: str = JWT_SECRET,
+        private_key_file: str = JWT_PRIVATE_KEY_FILE,
+        kid: str = JWT_KID,
+        jwks_file: str = JWT_JWKS_FILE,
+        reload_seconds: float = JWT_JWKS_RELOAD_SECONDS,
+    ):
+        if alg == "EdDSA":
+            raise RuntimeError("JWT_ALG=EdDSA is not supported by python-jose; use ES256")
+        self.alg = alg
+        self.asymmetric = alg in ASYMMETRIC_ALGS
+        self.kid = kid or None
+        self.jwks_file = jwks_file
+        self.reload_seconds = reload_seconds
+        self._checked_at = time.monotonic()
+        self._jwks_mtime = None
+        self._public: dict[str | None, dict] = {}
+
+        if not self.asymmetric:
+            self.signing_key = secret
+            return
+
+        if not private_key_file:
+            raise RuntimeError(f"JWT_ALG={alg} requires JWT_PRIVATE_KEY_FILE")
+        with open(private_key_file) as f:
+            self.signing_key = f.read()
+        if jwks_file:
+            self._load_jwks()
+        else:
+            public = jwk.construct(self.signing_key, alg).public_key().to_dict()
+            self._public = {self.kid: {**public, "kid": self.kid, "use": "sig"} if self.kid else public}
+
+    @property
+    def signing_headers(self) -> dict | None:
+        return {"kid": self.kid} if self.asymmetric and self.kid else None
+
+    def _load_jwks(self) -> None:
+        self._jwks_mtime = os.stat(self.jwks_file).st_mtime_ns
+        with open(self.jwks_file) as f:
+            keys = json.load(f)["keys"]
+        self._public = {k.get("kid"): k for k in keys if k.get("alg", self.alg) == self.alg}
+
+    def refresh(self) -> bool:
+        """Re-read JWT_JWKS_FILE if it changed (checked at most every reload_seconds); True when keys changed."""
+        if not self.jwks_file or time.monotonic() - self._checked_at < self.reload_seconds:
+            return False
+        self._checked_at = time.monotonic()
+        if os.stat(self.jwks_file).st_mtime_ns == self._jwks_mtime:
+            return False
+        self._load_jwks()
+        return True
+
+    def verification_key(self, kid: str | None):
+        """Key for a token with this header kid; None when no accepted key matches."""
+        if not self.asymmetric:
+            return self.signing_key
+        return self._public.get(kid)
+
+    def public_jwks(self) -> dict:
+        return {"keys": list(self._public.values())}
+
+
+_keys: KeySet | None = None
+
+
+def get_keys() -> KeySet:
+    global _keys
+    if _keys is None:
+        _keys = KeySet()
+    return _keys
+
+
+def set_keys(keys: KeySet) -> None:
+    """Swap the key set (e.g. generated keys in tests)."""
+    global _keys
+    _keys = keys
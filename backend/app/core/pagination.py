@@ -0,0 +1,96 @@
+import base64
+import binascii
+import json
+
+from fastapi import HTTPException
+from sqlalchemy import BigInteger, Integer, SmallInteger, bindparam, tuple_
+from sqlalchemy.types import TypeEngine
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+TOTAL_COUNT_HEADER = "X-Total-Count"
+TOTAL_COUNT_EXACT_HEADER = "X-Total-Count-Exact"  # "false" when the count is capped or estimated
+
+
+def encode_cursor(values: list) -> str:
+    # opaque for clients: base64url(JSON list of the last row's sort keys)
+    raw = json.dumps(values, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+# value range each integer key type accepts; a cursor value outside it would fail in the driver
+INTEGER_RANGES = {
+    SmallInteger: (-2**15, 2**15 - 1),
+    BigInteger: (-2**63, 2**63 - 1),
+    Integer: (-2**31, 2**31 - 1),
+}
+
+
+def _valid_key_value(value, type_: TypeEngine) -> bool:
+    if isinstance(value, bool):
+        return False
+    for integer_type, (low, high) in INTEGER_RANGES.items():
+        if isinstance(type_, integer_type):
+            return isinstance(value, int) and low <= value <= high
+    # float / expression keys (sort_key() uses +/-Infinity for NULLs)
+    return isinstance(value, (int, float))
+
+
+def decode_cursor(cursor: str, key_types: list[TypeEngine]) -> list:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, binascii.Error):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    if (
+        not isinstance(values, list)
+        or len(values) != len(key_types)
+        or not all(_valid_key_value(v, t) for v, t in zip(values, key_types))
+    ):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    return values
+
+
+def keyset_paginate(stmt, keys: list, cursor: str | None, limit: int | None, descending: bool = True):
+    """
+    Keyset (seek) pagination: ORDER BY keys + WHERE (keys) < (last seen keys).
+    Page N costs the same as page 1 when `keys` match an index.
+    We fetch limit + 1 rows so the caller knows whether a next page exists.
+    """
+    stmt = keyset_template(stmt, keys, bool(cursor), limit is not None, descending)
+    return stmt.params(**keyset_params(cursor, [k.type for k in keys], limit))
+
+
+def keyset_template(stmt, keys: list, has_cursor: bool, has_limit: bool, descending: bool = True):
+    """
+    keyset_paginate() with bind parameters (cursor_0.., page_limit) in place of values,
+    so a statement can be built once per shape and executed with keyset_params().
+    """
+    if has_cursor:
+        bound = tuple_(*[bindparam(f"cursor_{i}", type_=k.type) for i, k in enumerate(keys)])
+        stmt = stmt.where(tuple_(*keys) < bound if descending else tuple_(*keys) > bound)
+
+    stmt = stmt.order_by(*[k.desc() if descending else k.asc() for k in keys])
+
+    if has_limit:
+        stmt = stmt.limit(bindparam("page_limit", type_=Integer))
+    return stmt
+
+
+def keyset_params(cursor: str | None, key_types: list[TypeEngine], limit: int | None) -> dict:
+    params = {}
+    if cursor:
+        params.update({f"cursor_{i}": v for i, v in enumerate(decode_cursor(cursor, key_types))})
+    if limit is not None:
+        params["page_limit"] = limit + 1
+    return params
+
+
+def split_page(rows: list, limit: int | None, key_values) -> tuple[list, str | None]:
+    """Trim the extra look-ahead row and build next_cursor from the last row kept."""
+    if limit is None or len(rows) <= limit:
+        return rows, None
+
+    rows = rows[:limit]
+    return rows, encode_cursor(list(key_values(rows[-1])))
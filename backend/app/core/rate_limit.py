@@ -0,0 +1,222 @@
+import json
+import logging
+import math
+import time
+
+from fastapi import HTTPException
+
+from .cache import TTLCache, get_redis
+from .config import (
+    RATE_LIMIT_ENABLED,
+    RATE_LIMIT_USER_RATE,
+    RATE_LIMIT_USER_BURST,
+    RATE_LIMIT_IP_RATE,
+    RATE_LIMIT_IP_BURST,
+    RATE_LIMIT_REDIS,
+    RATE_LIMIT_MAX_KEYS,
+)
+from .metrics import Counter
+from .security import decode_access_token
+
+logger = logging.getLogger("wisekey.rate_limit")
+
+RATE_LIMITED = Counter(
+    "wisekey_rate_limited_total",
+    "requests rejected with 429, by the bucket that ran out (ip / user)",
+    labelnames=("bucket",),
+)
+RATE_LIMIT_STORE_ERRORS = Counter(
+    "wisekey_rate_limit_store_errors_total",
+    "bucket store failures (the request is let through)",
+)
+
+# tokens a request spends, by exact path; everything else costs DEFAULT_COST.
+# 0 = not limited (and not subject to admission control).
+DEFAULT_COST = 1
+ROUTE_COSTS = {
+    "/health": 0,
+    "/metrics": 0,
+    "/.well-known/jwks.json": 0,
+    # bcrypt-bound
+    "/auth/login": 10,
+    "/auth/register": 10,
+    "/properties/search": 3,
+    "/properties/facets": 3,
+    "/properties/search/count": 2,
+    "/properties/bulk": 20,
+    "/properties/export": 10,
+}
+
+
+def route_cost(path: str) -> int:
+    return ROUTE_COSTS.get(path, DEFAULT_COST)
+
+
+# Bucket = (key, rate per second, burst). take() is all-or-nothing over the buckets
+# and returns None when the cost was spent, else (blocked bucket index, seconds to wait).
+
+
+def _refill(tokens: float, updated: float, now: float, rate: float, burst: float) -> float:
+    return min(burst, tokens + max(0.0, now - updated) * rate)
+
+
+class MemoryBucketStore:
+    """Buckets in this process (one event loop, so check-and-spend needs no lock)."""
+
+    def __init__(self, maxsize: int):
+        self.buckets = TTLCache(maxsize=maxsize, ttl=0)
+
+    async def take(self, buckets: list[tuple[str, float, float]], cost: float) -> tuple[int, float] | None:
+        now = time.monotonic()
+        levels = []
+        for i, (key, rate, burst) in enumerate(buckets):
+            tokens, updated = self.buckets.get(key) or (burst, now)
+            tokens = _refill(tokens, updated, now, rate, burst)
+            if tokens < cost:
+                return i, (cost - tokens) / rate
+            levels.append(tokens)
+
+        for (key, rate, burst), tokens in zip(buckets, levels):
+            # a bucket left alone this long is full again, so it can be dropped
+            self.buckets.set(key, (tokens - cost, now), ttl=burst / rate)
+        return None
+
+
+# KEYS = bucket keys; ARGV = cost, then rate and burst per key. Uses the server clock so
+# every worker sees the same time; numbers go back as strings (Lua floats become integers).
+TAKE_SCRIPT = """
+local cost = tonumber(ARGV[1])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local levels = {}
+for i, key in ipairs(KEYS) do
+    local rate = tonumber(ARGV[i * 2])
+    local burst = tonumber(ARGV[i * 2 + 1])
+    local state = redis.call('HMGET', key, 'tokens', 'ts')
+    local tokens = tonumber(state[1]) or burst
+    local ts = tonumber(state[2]) or now
+    tokens = math.min(burst, tokens + math.max(0, now - ts) * rate)
+    if tokens < cost then
+        return {i - 1, tostring((cost - tokens) / rate)}
+    end
+    levels[i] = tokens
+end
+for i, key in ipairs(KEYS) do
+    local rate = tonumber(ARGV[i * 2])
+    local burst = tonumber(ARGV[i * 2 + 1])
+    redis.call('HSET', key, 'tokens', tostring(levels[i] - cost), 'ts', tostring(now))
+    redis.call('PEXPIRE', key, math.ceil(burst / rate * 1000))
+end
+return -1
+"""
+
+REDIS_PREFIX = "wisekey:rl:"
+
+
+class RedisBucketStore:
+    """Buckets shared by all workers: one atomic script call per request (redis.asyncio-compatible client)."""
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.script = redis.register_script(TAKE_SCRIPT)
+
+    async def take(self, buckets: list[tuple[str, float, float]], cost: float) -> tuple[int, float] | None:
+        args = [cost]
+        for _, rate, burst in buckets:
+            args += [rate, burst]
+        res = await self.script(keys=[REDIS_PREFIX + key for key, _, _ in buckets], args=args)
+        if res == -1:
+            return None
+        index, wait = res
+        return int(index), float(wait)
+
+
+_store = None
+
+
+def get_bucket_store():
+    global _store
+    if _store is None:
+        redis = get_redis() if RATE_LIMIT_REDIS else None
+        _store = RedisBucketStore(redis) if redis is not None else MemoryBucketStore(RATE_LIMIT_MAX_KEYS)
+    return _store
+
+
+def set_bucket_store(store) -> None:
+    """Swap the store (e.g. one over fakeredis in tests)."""
+    global _store
+    _store = store
+
+
+def _token_user(scope) -> str | None:
+    for name, value in scope["headers"]:
+        if name == b"authorization":
+            scheme, _, token = value.decode("latin-1").partition(" ")
+            if scheme.lower() != "bearer" or not token:
+                return None
+            # only a verified token gets a user bucket: an unverified "sub" could drain someone else's
+            try:
+                return decode_access_token(token.strip()).get("sub")
+            except HTTPException:
+                return None
+    return None
+
+
+async def send_error(send, status: int, detail: str, headers: list[tuple[bytes, bytes]]) -> None:
+    body = json.dumps({"detail": detail}).encode("utf-8")
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode("latin-1")),
+            *headers,
+        ],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+class RateLimitMiddleware:
+    """
+    Pure ASGI token-bucket limiter: 429 with Retry-After once the client IP's bucket (or,
+    for a valid access token, the user's bucket) can't pay the route's cost. If the bucket
+    store fails the request goes through: an outage of Redis must not take the API down.
+    """
+
+    def __init__(self, app, enabled: bool = RATE_LIMIT_ENABLED):
+        self.app = app
+        self.enabled = enabled
+
+    async def __call__(self, scope, receive, send):
+        if not self.enabled or scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        cost = route_cost(scope["path"])
+        if cost == 0:
+            await self.app(scope, receive, send)
+            return
+
+        client = scope.get("client")
+        names = ["ip"]
+        buckets = [(f"ip:{client[0] if client else 'unknown'}", RATE_LIMIT_IP_RATE, RATE_LIMIT_IP_BURST)]
+        user = _token_user(scope)
+        if user is not None:
+            names.append("user")
+            buckets.append((f"user:{user}", RATE_LIMIT_USER_RATE, RATE_LIMIT_USER_BURST))
+
+        try:
+            blocked = await get_bucket_store().take(buckets, cost)
+        except Exception:
+            RATE_LIMIT_STORE_ERRORS.inc()
+            logger.warning("rate limit store failed, request let through", exc_info=True)
+            blocked = None
+
+        if blocked is None:
+            await self.app(scope, receive, send)
+            return
+
+        index, wait = blocked
+        RATE_LIMITED.inc(bucket=names[index])
+        retry_after = str(max(1, math.ceil(wait))).encode("latin-1")
+        await send_error(send, 429, "Too many requests", [(b"retry-after", retry_after)])
@@ -0,0 +1,124 @@
+import hashlib
+import json
+
+from .cache import TTLCache, get_redis
+from .config import SEARCH_CACHE_TTL_SECONDS, SEARCH_CACHE_MAX_ENTRIES, SEARCH_CACHE_MAX_BODY_BYTES, SEARCH_CACHE_REDIS
+from .metrics import Counter
+
+SEARCH_CACHE_LOOKUPS = Counter(
+    "wisekey_search_cache_lookups_total",
+    "search result cache lookups, by tier and hit/miss",
+    labelnames=("tier", "result"),
+)
+SEARCH_CACHE_EVICTIONS = Counter(
+    "wisekey_search_cache_evictions_total",
+    "search result cache entries dropped before expiry (lru = over capacity, invalidated = owner wrote)",
+    labelnames=("tier", "reason"),
+)
+SEARCH_CACHE_TOO_LARGE = Counter(
+    "wisekey_search_cache_too_large_total",
+    "search pages not cached because the body is over SEARCH_CACHE_MAX_BODY_BYTES",
+)
+
+REDIS_PREFIX = "wisekey:search:"
+
+
+def search_cache_key(owner_id: int, etag: str, request_shape) -> str:
+    """
+    Key for one search: the owner, their data version (ETag) and the request as the handler
+    parsed it (filter signature and bind values, sort, page, fields...). Values are used as
+    parsed, never normalized, so two requests share an entry only if they run the same query.
+    """
+    raw = json.dumps([owner_id, etag, request_shape], separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class SearchCache:
+    """
+    Serialized search pages ({"body": json text, "next_cursor": ...}) per owner.
+    Tier 1 is an in-process LRU; tier 2 (optional) is a redis.asyncio-compatible client
+    shared by all workers, with a per-owner key set so an owner's entries can be dropped together.
+    Pages over max_body_bytes are never stored, so memory stays under about maxsize * max_body_bytes.
+    """
+
+    def __init__(self, maxsize: int, ttl: float, redis=None, max_body_bytes: int = SEARCH_CACHE_MAX_BODY_BYTES):
+        self.local = TTLCache(maxsize=maxsize, ttl=ttl)
+        self.redis = redis
+        self.ttl = ttl
+        self.max_body_bytes = max_body_bytes
+
+    @staticmethod
+    def _redis_key(owner_id: int, key: str) -> str:
+        return f"{REDIS_PREFIX}{owner_id}:{key}"
+
+    @staticmethod
+    def _redis_index(owner_id: int) -> str:
+        return f"{REDIS_PREFIX}{owner_id}:keys"
+
+    def _set_local(self, owner_id: int, key: str, value: dict) -> None:
+        evictions = self.local.evictions
+        self.local.set((owner_id, key), value)
+        if self.local.evictions > evictions:
+            SEARCH_CACHE_EVICTIONS.inc(self.local.evictions - evictions, tier="memory", reason="lru")
+
+    async def get(self, owner_id: int, key: str) -> dict | None:
+        value = self.local.get((owner_id, key))
+        SEARCH_CACHE_LOOKUPS.inc(tier="memory", result="miss" if value is None else "hit")
+        if value is not None or self.redis is None:
+            return value
+
+        raw = await self.redis.get(self._redis_key(owner_id, key))
+        SEARCH_CACHE_LOOKUPS.inc(tier="redis", result="miss" if raw is None else "hit")
+        if raw is None:
+            return None
+
+        value = json.loads(raw)
+        self._set_local(owner_id, key, value)
+        return value
+
+    async def set(self, owner_id: int, key: str, value: dict) -> None:
+        if len(value["body"].encode("utf-8")) > self.max_body_bytes:
+            SEARCH_CACHE_TOO_LARGE.inc()
+            return
+
+        self._set_local(owner_id, key, value)
+        if self.redis is None:
+            return
+
+        ttl_ms = int(self.ttl * 1000)
+        index = self._redis_index(owner_id)
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.set(self._redis_key(owner_id, key), json.dumps(value), px=ttl_ms)
+            pipe.sadd(index, key)
+            pipe.pexpire(index, ttl_ms)
+            await pipe.execute()
+
+    async def invalidate_owner(self, owner_id: int) -> None:
+        dropped = self.local.delete_matching(lambda k: k[0] == owner_id)
+        if dropped:
+            SEARCH_CACHE_EVICTIONS.inc(dropped, tier="memory", reason="invalidated")
+        if self.redis is None:
+            return
+
+        index = self._redis_index(owner_id)
+        keys = [k.decode() if isinstance(k, bytes) else k for k in await self.redis.smembers(index)]
+        await self.redis.delete(index, *[self._redis_key(owner_id, k) for k in keys])
+        if keys:
+            SEARCH_CACHE_EVICTIONS.inc(len(keys), tier="redis", reason="invalidated")
+
+
+_cache = None
+
+
+def get_search_cache() -> SearchCache:
+    global _cache
+    if _cache is None:
+        redis = get_redis() if SEARCH_CACHE_REDIS else None
+        _cache = SearchCache(maxsize=SEARCH_CACHE_MAX_ENTRIES, ttl=SEARCH_CACHE_TTL_SECONDS, redis=redis)
+    return _cache
+
+
+def set_search_cache(cache: SearchCache) -> None:
+    """Swap the cache (e.g. one over fakeredis in tests)."""
+    global _cache
+    _cache = cache
@@ -1,8 +1,37 @@
+import asyncio
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timedelta
 from jose import jwt
 import bcrypt
-
-from .config import JWT_SECRET, JWT_ALG, ACCESS_TOKEN_MINUTES, REFRESH_TOKEN_DAYS
+from fastapi import HTTPException
+
+from .cache import TTLCache
+from .config import (
+    ACCESS_TOKEN_MINUTES,
+    REFRESH_TOKEN_DAYS,
+    BCRYPT_ROUNDS,
+    BCRYPT_POOL,
+    BCRYPT_WORKERS,
+    BCRYPT_MAX_QUEUE,
+    JWT_VERIFY_CACHE_SIZE,
+)
+from .jwt_keys import KeySet, get_keys
+from .metrics import Counter, Gauge, Histogram
+
+BCRYPT_QUEUE_DEPTH = Gauge("wisekey_bcrypt_queue_depth", "bcrypt jobs waiting for a pool slot")
+BCRYPT_IN_FLIGHT = Gauge("wisekey_bcrypt_in_flight", "bcrypt jobs running in the pool")
+BCRYPT_SECONDS = Histogram(
+    "wisekey_bcrypt_seconds",
+    "bcrypt hash/verify time in the pool",
+    labelnames=("op",),
+    buckets=(0.05, 0.1, 0.2, 0.3, 0.5, 1.0, 2.0, 5.0),
+)
+JWT_VERIFY_CACHE_LOOKUPS = Counter(
+    "wisekey_jwt_verify_cache_lookups_total",
+    "access token checks answered from the verified-token cache (hit) or by a full verify (miss)",
+    labelnames=("result",),
+)
 
 
 def _normalize_password(password: str) -> bytes:
@@ -15,7 +44,7 @@ def _normalize_password(password: str) -> bytes:
 
 def hash_password(password: str) -> str:
     pw = _normalize_password(password)
-    hashed = bcrypt.hashpw(pw, bcrypt.gensalt())
+    hashed = bcrypt.hashpw(pw, bcrypt.gensalt(rounds=BCRYPT_ROUNDS))
     return hashed.decode("utf-8")
 
 
@@ -27,32 +56,113 @@ def verify_password(plain: str, hashed: str) -> bool:
         return False
 
 
+def password_needs_rehash(hashed: str) -> bool:
+    # "$2b$<cost>$<salt+hash>"
+    try:
+        return int(hashed.split("$")[2]) != BCRYPT_ROUNDS
+    except (IndexError, ValueError):
+        return True
+
+
+# --- async wrappers: bcrypt takes ~100-300 ms, never run it on the event loop ---
+
+_executor: Executor | None = None
+_slots: asyncio.Semaphore | None = None
+
+
+def _get_executor() -> Executor:
+    global _executor
+    if _executor is None:
+        if BCRYPT_POOL == "process":
+            _executor = ProcessPoolExecutor(max_workers=BCRYPT_WORKERS)
+        else:
+            # bcrypt releases the GIL, so threads hash in parallel
+            _executor = ThreadPoolExecutor(max_workers=BCRYPT_WORKERS, thread_name_prefix="bcrypt")
+    return _executor
+
+
+async def _run_in_pool(op: str, fn, *args):
+    global _slots
+    if _slots is None:
+        _slots = asyncio.Semaphore(BCRYPT_WORKERS)
+
+    # the semaphore (not the executor's unbounded queue) holds waiting jobs,
+    # so queue depth is observable and a login storm is shed instead of piling up
+    if BCRYPT_QUEUE_DEPTH.get() >= BCRYPT_MAX_QUEUE:
+        raise HTTPException(status_code=503, detail="Server busy, try again later")
+
+    BCRYPT_QUEUE_DEPTH.inc()
+    try:
+        await _slots.acquire()
+    finally:
+        BCRYPT_QUEUE_DEPTH.dec()
+
+    BCRYPT_IN_FLIGHT.inc()
+    try:
+        with BCRYPT_SECONDS.time(op=op):
+            return await asyncio.get_running_loop().run_in_executor(_get_executor(), fn, *args)
+    finally:
+        BCRYPT_IN_FLIGHT.dec()
+        _slots.release()
+
+
+async def hash_password_async(password: str) -> str:
+    return await _run_in_pool("hash", hash_password, password)
+
+
+async def verify_password_async(plain: str, hashed: str) -> bool:
+    return await _run_in_pool("verify", verify_password, plain, hashed)
+
+
+def _encode(claims: dict) -> str:
+    keys = get_keys()
+    return jwt.encode(claims, keys.signing_key, algorithm=keys.alg, headers=keys.signing_headers)
+
+
 def create_access_token(sub: str) -> str:
     exp = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_MINUTES)
-    return jwt.encode(
-        {"sub": sub, "type": "access", "exp": exp},
-        JWT_SECRET,
-        algorithm=JWT_ALG,
-    )
+    return _encode({"sub": sub, "type": "access", "exp": exp})
 
 
 def create_refresh_token(sub: str) -> str:
     exp = datetime.utcnow() + timedelta(days=REFRESH_TOKEN_DAYS)
-    return jwt.encode(
-        {"sub": sub, "type": "refresh", "exp": exp},
-        JWT_SECRET,
-        algorithm=JWT_ALG,
-    )
+    return _encode({"sub": sub, "type": "refresh", "exp": exp})
 
 
-def decode_access_token(token: str) -> dict:
-    from fastapi import HTTPException
+# signature -> (header.payload, key set, claims) of tokens that passed verification, each kept
+# until its own exp; a hit needs the same signing input and key set, so only the exact token matches
+_verified = TTLCache(maxsize=JWT_VERIFY_CACHE_SIZE, ttl=0)
+
 
+def _verify(token: str, keys: KeySet) -> dict:
     try:
-        payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALG])
+        key = keys.verification_key(jwt.get_unverified_header(token).get("kid"))
+        if key is None:
+            raise HTTPException(status_code=401, detail="Invalid token")
+        return jwt.decode(token, key, algorithms=[keys.alg])
+    except HTTPException:
+        raise
     except Exception:
         raise HTTPException(status_code=401, detail="Invalid token")
 
+
+def decode_access_token(token: str) -> dict:
+    keys = get_keys()
+    if keys.refresh():
+        _verified.clear()  # a key may have been withdrawn
+
+    signing_input, _, signature = token.rpartition(".")
+    cached = _verified.get(signature)
+    if cached is not None and cached[0] == signing_input and cached[1] is keys:
+        JWT_VERIFY_CACHE_LOOKUPS.inc(result="hit")
+        payload = cached[2]
+    else:
+        JWT_VERIFY_CACHE_LOOKUPS.inc(result="miss")
+        payload = _verify(token, keys)
+        exp = payload.get("exp")
+        if isinstance(exp, (int, float)):
+            _verified.set(signature, (signing_input, keys, payload), ttl=exp - time.time())
+
     if payload.get("type") != "access":
         raise HTTPException(status_code=401, detail="Not an access token")
 
@@ -0,0 +1,63 @@
+"""
+Fast path for large list responses: row tuples -> JSON bytes without building a Pydantic
+model per row. The output is byte-identical to FastAPI's JSONResponse for the same
+response_model, so rows must already have the model's types (plain column selects do).
+"""
+import json
+import typing
+
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # optional; the stdlib encoder is used instead
+    orjson = None
+
+# orjson and float.__repr__ (used by json.dumps) agree on every finite float in this
+# range; outside it they write exponents differently (1e+16 vs 1e16, 1e-05 vs 0.00001)
+_ORJSON_SAFE_MIN = 1e-4
+_ORJSON_SAFE_MAX = 1e16
+
+
+def dumps_stdlib(content) -> bytes:
+    # same call as starlette's JSONResponse.render
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+def _base_type(annotation):
+    # Optional[X] -> X
+    args = [a for a in typing.get_args(annotation) if a is not type(None)]
+    return args[0] if args else annotation
+
+
+class RowEncoder:
+    """Encodes rows laid out in `model` field order as a JSON list of objects."""
+
+    def __init__(self, model: type[BaseModel]):
+        self.fields = list(model.model_fields)
+        self._float_idx = [
+            i for i, info in enumerate(model.model_fields.values()) if _base_type(info.annotation) is float
+        ]
+
+    def _orjson_safe(self, rows) -> bool:
+        for row in rows:
+            for i in self._float_idx:
+                v = row[i]
+                # NaN / inf fail this too and go to the stdlib, which rejects them like FastAPI does
+                if v and not (_ORJSON_SAFE_MIN <= abs(v) < _ORJSON_SAFE_MAX):
+                    return False
+        return True
+
+    def encode(self, rows) -> bytes:
+        fields = self.fields
+        content = [dict(zip(fields, row)) for row in rows]
+        if orjson is not None and self._orjson_safe(rows):
+            return orjson.dumps(content)
+        return dumps_stdlib(content)
+
+    def encode_row(self, row) -> bytes:
+        """A single row as a JSON object (detail endpoints)."""
+        content = dict(zip(self.fields, row))
+        if orjson is not None and self._orjson_safe([row]):
+            return orjson.dumps(content)
+        return dumps_stdlib(content)
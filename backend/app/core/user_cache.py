@@ -0,0 +1,44 @@
+from app.models.user import User
+
+from .cache import MemoryBackend, RedisBackend, get_redis
+from .config import USER_CACHE_TTL_SECONDS, USER_CACHE_MAX_ENTRIES
+
+# Only what auth and /users/me need; never the password hash
+CACHED_FIELDS = ("id", "email", "full_name", "role")
+
+_backend = None
+
+
+def get_user_cache():
+    """Redis when REDIS_URL is configured (shared by all workers), otherwise in-process LRU."""
+    global _backend
+    if _backend is None:
+        redis = get_redis()
+        if redis is not None:
+            _backend = RedisBackend(redis, prefix="wisekey:user:", ttl=USER_CACHE_TTL_SECONDS)
+        else:
+            _backend = MemoryBackend(maxsize=USER_CACHE_MAX_ENTRIES, ttl=USER_CACHE_TTL_SECONDS)
+    return _backend
+
+
+def set_user_cache(backend) -> None:
+    """Swap the backend (e.g. RedisBackend over fakeredis in tests)."""
+    global _backend
+    _backend = backend
+
+
+async def get_cached_user(user_id: int) -> User | None:
+    data = await get_user_cache().get(str(user_id))
+    if data is None:
+        return None
+    # detached instance: handlers only read its attributes
+    return User(**data)
+
+
+async def cache_user(user: User) -> None:
+    await get_user_cache().set(str(user.id), {f: getattr(user, f) for f in CACHED_FIELDS})
+
+
+async def invalidate_user(user_id: int) -> None:
+    """Call after changing or deleting a user so the next request reloads it."""
+    await get_user_cache().delete(str(user_id))
@@ -0,0 +1,29 @@
+import json
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.base import Executable
+from sqlalchemy.sql.elements import ClauseElement
+from sqlalchemy.sql.visitors import InternalTraversal
+
+
+class Explain(Executable, ClauseElement):
+    """EXPLAIN (FORMAT JSON) <statement>, keeping the statement's bind parameters."""
+
+    inherit_cache = True
+    _traverse_internals = [("statement", InternalTraversal.dp_clauseelement)]
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(Explain, "postgresql")
+def _compile_explain(element, compiler, **kw):
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+async def estimate_rows(db: AsyncSession, statement, params: dict | None = None) -> int:
+    """Planner row estimate for `statement` (no rows are read); only as good as the table statistics."""
+    raw = (await db.execute(Explain(statement), params or {})).scalar_one()
+    plan = (json.loads(raw) if isinstance(raw, str) else raw)[0]
+    return int(plan["Plan"]["Plan Rows"])
@@ -0,0 +1,90 @@
+"""
+SQL statement timing via cursor events: a per-engine latency histogram, per-request
+query count / DB time (read by the HTTP metrics middleware) and an optional slow-query log.
+"""
+import logging
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.config import SLOW_QUERY_MS
+from app.core.metrics import Counter, Histogram
+
+logger = logging.getLogger("wisekey.sql")
+
+DB_QUERY_SECONDS = Histogram(
+    "wisekey_db_query_seconds",
+    "SQL statement execution time (cursor execute to result)",
+    labelnames=("pool",),
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0),
+)
+DB_SLOW_QUERIES = Counter(
+    "wisekey_db_slow_queries_total",
+    "statements slower than SLOW_QUERY_MS",
+    labelnames=("pool",),
+)
+
+
+@dataclass
+class RequestDBStats:
+    queries: int = 0
+    seconds: float = 0.0
+
+
+# set per HTTP request by MetricsMiddleware; SQLAlchemy's greenlets carry the context over
+_request_stats: ContextVar[RequestDBStats | None] = ContextVar("request_db_stats", default=None)
+
+
+def track_request_db():
+    """Start counting statements for the current request; returns (stats, token for untrack)."""
+    stats = RequestDBStats()
+    return stats, _request_stats.set(stats)
+
+
+def untrack_request_db(token) -> None:
+    _request_stats.reset(token)
+
+
+def _shape(value) -> str:
+    if isinstance(value, (list, tuple)):
+        return f"{type(value).__name__}[{len(value)}]"
+    return type(value).__name__
+
+
+def param_shape(parameters, executemany: bool) -> str:
+    """Parameter types and counts, never values (they may hold personal data)."""
+    rows = parameters if executemany else [parameters]
+    first = rows[0] if rows else ()
+    if isinstance(first, dict):
+        types = ", ".join(f"{k}: {_shape(v)}" for k, v in first.items())
+    else:
+        types = ", ".join(_shape(v) for v in first)
+    return f"{len(rows)} x ({types})"
+
+
+def instrument_engine(engine: AsyncEngine, label: str) -> None:
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info["query_started"] = time.perf_counter()
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info.pop("query_started", time.perf_counter())
+        DB_QUERY_SECONDS.observe(elapsed, pool=label)
+
+        stats = _request_stats.get()
+        if stats is not None:
+            stats.queries += 1
+            stats.seconds += elapsed
+
+        if SLOW_QUERY_MS and elapsed * 1000 >= SLOW_QUERY_MS:
+            DB_SLOW_QUERIES.inc(pool=label)
+            logger.warning(
+                "slow query (%.1f ms, %s): %s | params: %s",
+                elapsed * 1000, label, " ".join(statement.split()), param_shape(parameters, executemany),
+            )
@@ -0,0 +1,39 @@
+from sqlalchemy import event
+from sqlalchemy.engine.interfaces import ExecuteStyle
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+class QueryCounter:
+    """
+    Records every SQL statement sent through the given engines while active
+    (before_cursor_execute), i.e. the database round trips of a block of code.
+    A DBAPI executemany() counts once per parameter set: the server runs each separately.
+
+        with QueryCounter(engine) as queries:
+            ...
+        assert queries.count == 1, queries.statements
+    """
+
+    def __init__(self, *engines: AsyncEngine):
+        self.engines = [e.sync_engine for e in engines]
+        self.statements: list[str] = []
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        # insertmanyvalues pages are also flagged executemany, but are one statement each
+        if executemany and context is not None and context.execute_style is ExecuteStyle.EXECUTEMANY:
+            self.statements.extend([statement] * len(parameters))
+        else:
+            self.statements.append(statement)
+
+    def __enter__(self) -> "QueryCounter":
+        for engine in self.engines:
+            event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        for engine in self.engines:
+            event.remove(engine, "before_cursor_execute", self._before_cursor_execute)
@@ -1,16 +1,156 @@
-import os
-from dotenv import load_dotenv
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+import itertools
+import time
+from uuid import uuid4
 
-load_dotenv()
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.core.config import (
+    DATABASE_URL,
+    DB_POOL_SIZE,
+    DB_MAX_OVERFLOW,
+    DB_POOL_TIMEOUT,
+    DB_POOL_RECYCLE,
+    DB_POOL_PRE_PING,
+    DB_STATEMENT_CACHE_SIZE,
+    DB_PGBOUNCER,
+    DATABASE_REPLICA_URLS,
+    DB_REPLICA_STRATEGY,
+    READ_YOUR_WRITES_SECONDS,
+    READ_YOUR_WRITES_LOCAL,
+    REDIS_URL,
+)
+from app.core.cache import MemoryBackend, RedisBackend, get_redis
+from app.core.metrics import Counter, Histogram
+from app.db.instrumentation import instrument_engine
 
-DATABASE_URL = os.getenv("DATABASE_URL")
 if not DATABASE_URL:
     raise RuntimeError("DATABASE_URL is not set in .env")
 
-engine = create_async_engine(DATABASE_URL, echo=False)
+POOL_CHECKOUT_WAIT = Histogram(
+    "wisekey_db_pool_checkout_wait_seconds",
+    "time spent getting a pooled DB connection (incl. opening new ones)",
+    labelnames=("pool",),
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0),
+)
+READ_ROUTING = Counter(
+    "wisekey_db_read_routing_total",
+    "read sessions handed out, by target database",
+    labelnames=("target",),
+)
+POOL_CHECKOUT_TIMEOUTS = Counter(
+    "wisekey_db_pool_checkout_timeouts_total",
+    "checkouts that gave up after DB_POOL_TIMEOUT",
+    labelnames=("pool",),
+)
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long each checkout waited for a connection."""
+
+    label = "primary"
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            POOL_CHECKOUT_TIMEOUTS.inc(pool=self.label)
+            raise
+        finally:
+            POOL_CHECKOUT_WAIT.observe(time.perf_counter() - start, pool=self.label)
+
+
+def create_engine_from_config(url: str, label: str = "primary") -> AsyncEngine:
+    """The only place engines are built: pool and driver knobs come from app.core.config."""
+    connect_args = {"statement_cache_size": DB_STATEMENT_CACHE_SIZE}
+    if DB_PGBOUNCER:
+        # named prepared statements don't survive a PgBouncer transaction pool:
+        # disable asyncpg's and SQLAlchemy's statement caches, use unique names
+        url = make_url(url).update_query_dict({"prepared_statement_cache_size": "0"})
+        connect_args = {
+            "statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+        }
+
+    engine = create_async_engine(
+        url,
+        echo=False,
+        poolclass=type("InstrumentedQueuePool", (InstrumentedQueuePool,), {"label": label}),
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_recycle=DB_POOL_RECYCLE,
+        pool_pre_ping=DB_POOL_PRE_PING,
+        connect_args=connect_args,
+    )
+    instrument_engine(engine, label)
+    return engine
+
+
+engine = create_engine_from_config(DATABASE_URL)
 AsyncSessionLocal = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
 
 async def get_db():
     async with AsyncSessionLocal() as session:
         yield session
+
+
+# --- read replicas ---
+
+if DATABASE_REPLICA_URLS and not REDIS_URL and not READ_YOUR_WRITES_LOCAL:
+    # per-worker markers would let a read on another worker hit a lagging replica right after a write
+    raise RuntimeError(
+        "DATABASE_REPLICA_URLS needs REDIS_URL so read-your-writes holds across workers "
+        "(set READ_YOUR_WRITES_LOCAL=true only when running a single worker)"
+    )
+
+replica_engines = [
+    create_engine_from_config(url, label=f"replica{i}") for i, url in enumerate(DATABASE_REPLICA_URLS)
+]
+_replica_sessionmakers = [
+    async_sessionmaker(e, expire_on_commit=False, class_=AsyncSession) for e in replica_engines
+]
+_round_robin = itertools.count()
+_recent_writes = None
+
+
+def _recent_writes_store():
+    # shared through Redis so read-your-writes holds across workers; the in-process
+    # fallback is only reached with READ_YOUR_WRITES_LOCAL (checked at import)
+    global _recent_writes
+    if _recent_writes is None:
+        redis = get_redis()
+        if redis is not None:
+            _recent_writes = RedisBackend(redis, prefix="wisekey:wrote:", ttl=READ_YOUR_WRITES_SECONDS)
+        else:
+            _recent_writes = MemoryBackend(maxsize=100_000, ttl=READ_YOUR_WRITES_SECONDS)
+    return _recent_writes
+
+
+async def mark_write(user_id: int) -> None:
+    """Pin this user's reads to the primary for READ_YOUR_WRITES_SECONDS."""
+    if replica_engines:
+        await _recent_writes_store().set(str(user_id), 1)
+
+
+def _pick_replica() -> int:
+    start = next(_round_robin) % len(replica_engines)
+    if DB_REPLICA_STRATEGY == "least_connections":
+        # fewest connections currently checked out; rotating start spreads ties
+        order = [(start + i) % len(replica_engines) for i in range(len(replica_engines))]
+        return min(order, key=lambda i: replica_engines[i].pool.checkedout())
+    return start
+
+
+async def replica_sessionmaker_for(user_id: int) -> async_sessionmaker | None:
+    """Session factory for a replica, or None when reads must go to the primary."""
+    if not replica_engines or await _recent_writes_store().get(str(user_id)):
+        READ_ROUTING.inc(target="primary")
+        return None
+
+    i = _pick_replica()
+    READ_ROUTING.inc(target=f"replica{i}")
+    return _replica_sessionmakers[i]
@@ -1,10 +1,20 @@
-from fastapi import FastAPI
+import hmac
+
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from dotenv import load_dotenv
 
 load_dotenv()
 
 from app.routes import auth, users, properties
+from app.core.pagination import NEXT_CURSOR_HEADER, TOTAL_COUNT_EXACT_HEADER, TOTAL_COUNT_HEADER
+from app.core import metrics
+from app.core.http_metrics import MetricsMiddleware
+from app.core.admission import AdmissionMiddleware
+from app.core.rate_limit import RateLimitMiddleware
+from app.core.jwt_keys import get_keys
+from app.core.config import METRICS_ALLOW_IPS, METRICS_TOKEN
 
 app = FastAPI(title="WiseKey API")
 
@@ -13,13 +23,20 @@ origins = [
     "http://127.0.0.1:3000",
 ]
 
+# add_middleware wraps what was added before, so requests pass, outermost first:
+# metrics -> CORS (429/503 stay readable by the browser) -> rate limit -> admission control
+app.add_middleware(AdmissionMiddleware)
+app.add_middleware(RateLimitMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, TOTAL_COUNT_HEADER, TOTAL_COUNT_EXACT_HEADER, "ETag"],
 )
+# outermost: timings include CORS and every other middleware
+app.add_middleware(MetricsMiddleware)
 
 app.include_router(auth.router)
 app.include_router(users.router)
@@ -28,3 +45,24 @@ app.include_router(properties.router)
 @app.get("/health")
 def health():
     return {"status": "ok"}
+
+
+@app.get("/.well-known/jwks.json")
+def jwks():
+    """Public keys that verify our access tokens (empty with HS256: the secret is never published)."""
+    return get_keys().public_jwks()
+
+
+def _metrics_allowed(request: Request) -> bool:
+    # traffic, pool saturation and shed counts help plan an attack: scrapers only
+    if request.client and request.client.host in METRICS_ALLOW_IPS:
+        return True
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    return bool(METRICS_TOKEN) and scheme.lower() == "bearer" and hmac.compare_digest(token.strip(), METRICS_TOKEN)
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+def prometheus_metrics(request: Request):
+    if not _metrics_allowed(request):
+        raise HTTPException(status_code=403, detail="Forbidden")
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
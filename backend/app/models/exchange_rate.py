@@ -0,0 +1,24 @@
+from datetime import datetime
+
+from sqlalchemy import String, Float, DateTime, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+
+class ExchangeRate(Base):
+    """Locally loaded rates used to normalize Property.price into BASE_CURRENCY."""
+
+    __tablename__ = "exchange_rates"
+
+    currency: Mapped[str] = mapped_column(String(10), primary_key=True)  # upper-case ISO code
+
+    # 1 unit of `currency` = rate_to_base units of BASE_CURRENCY
+    rate_to_base: Mapped[float] = mapped_column(Float, nullable=False)
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
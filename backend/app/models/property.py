@@ -1,10 +1,65 @@
-from sqlalchemy import Column, Integer, String, Float, Text, ForeignKey, Boolean
+from sqlalchemy import (
+    Column, Integer, String, Float, Text, ForeignKey, Boolean, Index, Computed, FetchedValue, CheckConstraint, text,
+    func, literal_column,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred
 
 from app.models.base import Base
 
+# Postgres text search configuration created by the migrations:
+# english stemming for ASCII words, "simple" (lowercase only) for Georgian words.
+SEARCH_TS_CONFIG = "wisekey"
+
+SEARCH_VECTOR_SQL = (
+    f"setweight(to_tsvector('{SEARCH_TS_CONFIG}', coalesce(title, '')), 'A') || "
+    f"setweight(to_tsvector('{SEARCH_TS_CONFIG}', "
+    f"coalesce(city, '') || ' ' || coalesce(district, '') || ' ' || coalesce(street, '')), 'B') || "
+    f"setweight(to_tsvector('{SEARCH_TS_CONFIG}', coalesce(description, '')), 'C')"
+)
+
+PRICE_PER_SQM_SQL = "price_base / NULLIF(area_sqm, 0)"
+
+
+def sort_key(column, descending: bool = False):
+    """
+    NULL-free sort expression for keyset pagination (a row comparison against NULL is
+    never true): NULLs become +/-Infinity so they sort last in either direction.
+    Must stay textually identical to the ix_properties_owner_*_sort_* index expressions.
+    """
+    return func.coalesce(column, literal_column("'-Infinity'::float8" if descending else "'Infinity'::float8"))
+
 
 class Property(Base):
     __tablename__ = "properties"
+    __table_args__ = (
+        # Owner-leading B-tree indexes: every query is scoped to owner_id first
+        Index("ix_properties_owner_id_id", "owner_id", "id"),
+        Index("ix_properties_owner_price_base", "owner_id", "price_base"),
+        Index("ix_properties_owner_txn_price_base", "owner_id", "transaction_type", "price_base"),
+        Index("ix_properties_owner_currency_price_base", "owner_id", "currency", "price_base"),
+        Index("ix_properties_owner_txn_rooms", "owner_id", "transaction_type", "rooms"),
+        Index("ix_properties_owner_area", "owner_id", "area_sqm"),
+        Index(
+            "ix_properties_owner_comfort",
+            "owner_id", "has_balcony", "has_air_conditioning", "pets_allowed",
+        ),
+        # pg_trgm GIN indexes so ilike('%...%') can use an index
+        *[
+            Index(
+                f"ix_properties_{col}_trgm",
+                col,
+                postgresql_using="gin",
+                postgresql_ops={col: "gin_trgm_ops"},
+            )
+            for col in ("city", "district", "street")
+        ],
+        Index("ix_properties_search_vector", "search_vector", postgresql_using="gin"),
+        # built-in GiST point index; queries must use the same point(lon, lat) expression
+        Index("ix_properties_location", text("point(lon, lat)"), postgresql_using="gist"),
+        CheckConstraint("lat BETWEEN -90 AND 90", name="ck_properties_lat_range"),
+        CheckConstraint("lon BETWEEN -180 AND 180", name="ck_properties_lon_range"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
 
@@ -15,9 +70,17 @@ class Property(Base):
     district = Column(String(120), nullable=True)
     street = Column(String(180), nullable=True)
 
+    lat = Column(Float, nullable=True)  # WGS84 degrees
+    lon = Column(Float, nullable=True)
+
     currency = Column(String(10), nullable=True)  # GEL / USD
     price = Column(Float, nullable=True)          # numeric value in selected currency
 
+    # price converted to BASE_CURRENCY via exchange_rates; set by a DB trigger
+    # on insert / price or currency change, bulk-refreshed by recompute_price_base()
+    price_base = Column(Float, nullable=True, server_default=FetchedValue(), server_onupdate=FetchedValue())
+    price_per_sqm = Column(Float, Computed(PRICE_PER_SQM_SQL, persisted=True))
+
     area_sqm = Column(Float, nullable=True)
 
     rooms = Column(Integer, nullable=True)        # total rooms
@@ -34,6 +97,9 @@ class Property(Base):
     title = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
 
+    # Full-text search document, maintained by Postgres (never loaded by default)
+    search_vector = deferred(Column(TSVECTOR, Computed(SEARCH_VECTOR_SQL, persisted=True)))
+
     # Comfort / Infrastructure
     building_type = Column(String(50), nullable=True)      # new_building / old_building / private_house
     heating_type = Column(String(50), nullable=True)       # central / gas / electric / none
@@ -46,3 +112,20 @@ class Property(Base):
 
 
     owner_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+
+
+# (owner_id, sort key, id) per sort option: ORDER BY ... LIMIT becomes an index scan
+SORT_COLUMNS = {
+    "price": Property.price_base,
+    "area": Property.area_sqm,
+    "price_per_sqm": Property.price_per_sqm,
+}
+
+for _name, _column in SORT_COLUMNS.items():
+    for _descending in (False, True):
+        Index(
+            f"ix_properties_owner_{_name}_sort_{'desc' if _descending else 'asc'}",
+            Property.owner_id,
+            sort_key(_column, _descending),
+            Property.id,
+        )
@@ -0,0 +1,18 @@
+from sqlalchemy import BigInteger, Integer, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+
+class PropertyVersion(Base):
+    """
+    Per-owner change marker for conditional GETs (ETag). Maintained by statement-level
+    triggers on properties: every INSERT/UPDATE/DELETE sets it to the writing transaction id.
+    """
+
+    __tablename__ = "property_versions"
+
+    owner_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False)
@@ -2,9 +2,14 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.session import get_db
+from app.db.session import get_db, mark_write
 from app.models.user import User
-from app.core.security import hash_password, verify_password, create_access_token
+from app.core.security import (
+    hash_password_async,
+    verify_password_async,
+    password_needs_rehash,
+    create_access_token,
+)
 from app.schemas.auth import RegisterRequest, LoginRequest, TokenResponse
 
 router = APIRouter(prefix="/auth", tags=["auth"])
@@ -20,9 +25,12 @@ async def register(payload: RegisterRequest, db: AsyncSession = Depends(get_db))
     if existing:
         raise HTTPException(status_code=400, detail="User already exists")
 
+    # end the read transaction so the pooled connection isn't held while bcrypt runs
+    await db.commit()
+
     user = User(
         email=email,
-        hashed_password=hash_password(payload.password),
+        hashed_password=await hash_password_async(payload.password),
         full_name=payload.full_name.strip(),
         # role has default="buyer" in model, so we don't need to pass it (Variant A)
     )
@@ -30,6 +38,7 @@ async def register(payload: RegisterRequest, db: AsyncSession = Depends(get_db))
     db.add(user)
     await db.commit()
     await db.refresh(user)
+    await mark_write(user.id)  # the new user isn't on the replicas yet
 
     # IMPORTANT: use user.id as sub (stable), not email
     access = create_access_token(sub=str(user.id))
@@ -43,11 +52,20 @@ async def login(payload: LoginRequest, db: AsyncSession = Depends(get_db)):
     res = await db.execute(select(User).where(User.email == email))
     user = res.scalar_one_or_none()
 
-    if not user or not verify_password(payload.password, user.hashed_password):
+    # end the read transaction so the pooled connection isn't held while bcrypt runs
+    # (expire_on_commit=False keeps `user` loaded)
+    await db.commit()
+
+    if not user or not await verify_password_async(payload.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid credentials",
         )
 
+    # BCRYPT_ROUNDS changed since this hash was made: upgrade it transparently
+    if password_needs_rehash(user.hashed_password):
+        user.hashed_password = await hash_password_async(payload.password)
+        await db.commit()
+
     access = create_access_token(sub=str(user.id))
     return TokenResponse(access_token=access)
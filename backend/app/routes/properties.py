@@ -1,248 +1,704 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import select
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+from sqlalchemy import (
+    ColumnElement, Integer, select, insert, update, delete, exists, func, literal_column, tuple_, any_, bindparam,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.session import get_db
-from app.routes.users import get_current_user
+from app.core.bulk import BulkRowError, iter_csv, iter_ndjson
+from app.core.config import (
+    MAX_PAGE_SIZE, BULK_BATCH_SIZE, BULK_MAX_ERRORS, EXPORT_CHUNK_SIZE, BASE_CURRENCY, SEARCH_COUNT_CAP,
+)
+from app.core.etag import not_modified, properties_etag
+from app.core.export import csv_chunks, ndjson_chunks, parquet_available, parquet_chunks
+from app.core.filters import PROPERTY_FILTERS, SEARCH_TSQUERY, SearchFilters, search_filters
+from app.core.pagination import (
+    NEXT_CURSOR_HEADER, TOTAL_COUNT_EXACT_HEADER, TOTAL_COUNT_HEADER, keyset_paginate, keyset_params, keyset_template,
+    split_page,
+)
+from app.core.search_cache import get_search_cache, search_cache_key
+from app.core.serialize import RowEncoder
+from app.db.explain import estimate_rows
+from app.db.session import AsyncSessionLocal, get_db, mark_write, replica_sessionmaker_for
+from app.routes.users import get_current_user, get_read_db
 from app.models.user import User
-from app.models.property import Property
-from app.schemas.property import PropertyCreate, PropertyResponse
+from app.models.property import Property, SORT_COLUMNS, sort_key
+from app.schemas.property import (
+    PropertyCreate,
+    PropertyUpdate,
+    PropertyResponse,
+    PropertyBatchUpdate,
+    PropertyBatchDelete,
+    PropertyBatchResponse,
+    BatchItemResult,
+    BulkImportResponse,
+    BulkRowErrorResponse,
+    FacetValue,
+    HistogramBucket,
+    PropertyFacetsResponse,
+    PropertyCountResponse,
+    PropertyExistsResponse,
+    property_response_model,
+)
 
 router = APIRouter(prefix="/properties", tags=["properties"])
 
+async def _after_write(owner_id: int) -> None:
+    """Run after every committed change to an owner's properties."""
+    await mark_write(owner_id)
+    await get_search_cache().invalidate_owner(owner_id)
+
+
+def _json_response(response: Response, body: bytes | str) -> Response:
+    """Send an already serialized body with the headers set on `response` so far."""
+    return Response(content=body, media_type="application/json", headers=dict(response.headers))
+
+
+def _json_page(response: Response, page: dict) -> Response:
+    if page["next_cursor"]:
+        response.headers[NEXT_CURSOR_HEADER] = page["next_cursor"]
+    if page.get("total") is not None:
+        count, exact = page["total"]
+        response.headers[TOTAL_COUNT_HEADER] = str(count)
+        response.headers[TOTAL_COUNT_EXACT_HEADER] = "true" if exact else "false"
+    return _json_response(response, page["body"])
+
+
+def _column_values(payload: PropertyCreate, **extra) -> dict:
+    """Write payload -> column values in one mapping (schema fields are named after the columns)."""
+    return {**payload.model_dump(), "title": payload.title.strip(), **extra}
+
+
+PROPERTY_FIELDS = tuple(PropertyResponse.model_fields)
+
+
+@dataclass
+class PropertyProjection:
+    """
+    Read endpoints select exactly these columns and encode the rows directly (no ORM
+    objects, no per-row model validation); same bytes as the matching response model would give.
+    """
+    columns: list
+    encoder: RowEncoder
+
+
+@lru_cache(maxsize=256)
+def _projection(fields: tuple[str, ...]) -> PropertyProjection:
+    encoder = RowEncoder(property_response_model(fields))
+    return PropertyProjection(columns=[getattr(Property, f) for f in encoder.fields], encoder=encoder)
+
+
+def property_fields(
+    fields: str | None = Query(
+        default=None,
+        description="comma-separated PropertyResponse fields to return (id is always included); default: all",
+    ),
+) -> PropertyProjection:
+    if not fields:
+        return _projection(PROPERTY_FIELDS)
+
+    requested = {f.strip() for f in fields.split(",") if f.strip()}
+    unknown = requested.difference(PROPERTY_FIELDS)
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(sorted(unknown))}")
+
+    requested.add("id")
+    return _projection(tuple(f for f in PROPERTY_FIELDS if f in requested))
+
+BULK_FORMATS = {
+    "application/x-ndjson": iter_ndjson,
+    "application/jsonl": iter_ndjson,
+    "text/csv": iter_csv,
+}
+
+FACET_FIELDS = PROPERTY_FILTERS.facet_fields
+
+SearchSort = Literal[
+    "relevance",
+    "newest",
+    "price_asc",
+    "price_desc",
+    "area_asc",
+    "area_desc",
+    "price_per_sqm_asc",
+    "price_per_sqm_desc",
+]
+
+CountMode = Literal["exact", "capped", "estimated"]
+
+COUNT_MODE_DESCRIPTION = (
+    f"exact: count(*); capped: stops counting at {SEARCH_COUNT_CAP}; "
+    f"estimated: planner estimate when it is above {SEARCH_COUNT_CAP}, else as capped"
+)
+TOTAL_DESCRIPTION = f"also send the number of matching listings in {TOTAL_COUNT_HEADER} ({COUNT_MODE_DESCRIPTION})"
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+    "parquet": "application/vnd.apache.parquet",
+}
+
 
 @router.post("", response_model=PropertyResponse)
 async def create_property(
     payload: PropertyCreate,
+    response: Response,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    prop = Property(
-        title=payload.title.strip(),
-        description=payload.description,
-
-        # Basic Filters
-        transaction_type=payload.transaction_type,
-        city=payload.city,
-        district=payload.district,
-        street=payload.street,
-        currency=payload.currency,
-        price=payload.price,
-        area_sqm=payload.area_sqm,
-        rooms=payload.rooms,
-        bedrooms=payload.bedrooms,
-        bathrooms=payload.bathrooms,
-        floor=payload.floor,
-        total_floors=payload.total_floors,
-        not_first_floor=payload.not_first_floor,
-        condition=payload.condition,
-
-        # Comfort / Infrastructure
-        building_type=payload.building_type,
-        heating_type=payload.heating_type,
-        has_air_conditioning=payload.has_air_conditioning,
-        parking_type=payload.parking_type,
-        has_balcony=payload.has_balcony,
-        pets_allowed=payload.pets_allowed,
-        furnished=payload.furnished,
-
-        owner_id=current_user.id,
-    )
+    projection = _projection(PROPERTY_FIELDS)
+    stmt = insert(Property).values(**_column_values(payload), owner_id=current_user.id).returning(*projection.columns)
 
-    db.add(prop)
+    # one INSERT ... RETURNING: trigger/generated columns (price_base, price_per_sqm) come back with it
+    row = (await db.execute(stmt)).one()
     await db.commit()
-    await db.refresh(prop)
-    return prop
+    await _after_write(current_user.id)
+    return _json_response(response, projection.encoder.encode_row(row))
+
+
+# RETURNING makes SQLAlchemy send one INSERT ... VALUES (...), (...) per batch
+# ("insertmanyvalues"); without it asyncpg gets an executemany of single-row INSERTs,
+# each firing the statement-level version trigger. render_nulls keeps None keys, else
+# rows are grouped by key set and scattered blank cells split the batch row by row.
+BULK_INSERT = insert(Property).returning(Property.id).execution_options(render_nulls=True)
+
+
+async def _insert_batch(db: AsyncSession, batch: list[tuple[int, dict]], fail) -> int:
+    # one multi-row INSERT + one commit per batch
+    try:
+        await db.execute(BULK_INSERT, [values for _, values in batch])
+        await db.commit()
+        return len(batch)
+    except DBAPIError:
+        await db.rollback()
+
+    # the database rejected some row: retry one by one to report which
+    inserted = 0
+    for row_no, values in batch:
+        try:
+            await db.execute(BULK_INSERT, [values])
+            await db.commit()
+            inserted += 1
+        except DBAPIError as e:
+            await db.rollback()
+            # asyncpg's own exception (the cause) carries the readable message
+            fail(row_no, [str(e.orig.__cause__ or e.orig).splitlines()[0]])
+    return inserted
+
+
+@router.post("/bulk", response_model=BulkImportResponse)
+async def bulk_import_properties(
+    request: Request,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Stream NDJSON (application/x-ndjson) or CSV (text/csv, header row required) into properties.
+    Every row is validated with PropertyCreate; valid rows are inserted and committed in
+    batches of BULK_BATCH_SIZE, invalid rows are skipped and reported by row number.
+    """
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    parse = BULK_FORMATS.get(content_type)
+    if parse is None:
+        raise HTTPException(
+            status_code=415,
+            detail=f"Content-Type must be one of: {', '.join(BULK_FORMATS)}",
+        )
+
+    owner_id = current_user.id
+    inserted = 0
+    failed = 0
+    errors: list[BulkRowErrorResponse] = []
+    batch: list[tuple[int, dict]] = []
+
+    def fail(row_no: int, messages: list[str]):
+        nonlocal failed
+        failed += 1
+        if len(errors) < BULK_MAX_ERRORS:
+            errors.append(BulkRowErrorResponse(row=row_no, errors=messages))
+
+    try:
+        async for row_no, item in parse(request.stream()):
+            if isinstance(item, BulkRowError):
+                fail(row_no, [str(item)])
+                continue
+
+            try:
+                payload = PropertyCreate.model_validate(item)
+            except ValidationError as e:
+                fail(row_no, [
+                    f"{'.'.join(str(p) for p in err['loc'])}: {err['msg']}" for err in e.errors()
+                ])
+                continue
+
+            batch.append((row_no, _column_values(payload, owner_id=owner_id)))
+
+            if len(batch) >= BULK_BATCH_SIZE:
+                inserted += await _insert_batch(db, batch, fail)
+                batch = []
+    except UnicodeDecodeError:
+        if inserted:
+            await _after_write(owner_id)
+        raise HTTPException(
+            status_code=400,
+            detail=f"Body is not valid UTF-8 (rows inserted before the error: {inserted})",
+        )
+
+    if batch:
+        inserted += await _insert_batch(db, batch, fail)
+
+    if inserted:
+        await _after_write(owner_id)
+
+    return BulkImportResponse(inserted=inserted, failed=failed, errors=errors)
 
 
 @router.get("", response_model=list[PropertyResponse])
 async def list_properties(
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
+    projection: PropertyProjection = Depends(property_fields),
+    limit: int | None = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = Query(default=None, description="next_cursor from previous page"),
+    total: CountMode | None = Query(default=None, description=TOTAL_DESCRIPTION),
 ):
-    res = await db.execute(
-        select(Property)
-        .where(Property.owner_id == current_user.id)
-        .order_by(Property.id.desc())
+    etag = await properties_etag(db, current_user.id)
+    cached = not_modified(request, response, etag)
+    if cached:
+        return cached
+
+    keys = [Property.id]
+    stmt = select(*projection.columns, *keys).where(Property.owner_id == current_user.id)
+    stmt = keyset_paginate(stmt, keys, cursor, limit)
+
+    res = await db.execute(stmt)
+    rows, next_cursor = split_page(list(res.all()), limit, lambda row: row[len(projection.columns):])
+
+    page = {"body": projection.encoder.encode(rows).decode("utf-8"), "next_cursor": next_cursor}
+    if total is not None:
+        page["total"] = await _count_matching(db, current_user.id, (), {}, total)
+    return _json_page(response, page)
+
+
+@router.get("/export")
+async def export_properties(
+    current_user: User = Depends(get_current_user),
+    fmt: Literal["ndjson", "csv", "parquet"] = Query(default="ndjson", alias="format"),
+):
+    """Stream the whole portfolio (PropertyResponse columns) with flat memory use."""
+    if fmt == "parquet" and not parquet_available():
+        raise HTTPException(status_code=501, detail="Parquet export requires the pyarrow package")
+
+    owner_id = current_user.id
+    fields = list(PropertyResponse.model_fields)
+    stmt = (
+        select(*[getattr(Property, f) for f in fields])
+        .where(Property.owner_id == owner_id)
+        .order_by(Property.id)
+        .execution_options(yield_per=EXPORT_CHUNK_SIZE)
+    )
+
+    async def partitions():
+        # own session: the body is streamed after the request's get_db session is closed
+        maker = await replica_sessionmaker_for(owner_id) or AsyncSessionLocal
+        async with maker() as session:
+            result = await session.stream(stmt)
+            async for rows in result.partitions():
+                yield rows
+
+    if fmt == "parquet":
+        annotations = {f: info.annotation for f, info in PropertyResponse.model_fields.items()}
+        body = parquet_chunks(partitions(), fields, annotations)
+    elif fmt == "csv":
+        body = csv_chunks(partitions(), fields)
+    else:
+        body = ndjson_chunks(partitions(), fields)
+
+    return StreamingResponse(
+        body,
+        media_type=EXPORT_MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="properties.{fmt}"'},
+    )
+
+
+@lru_cache(maxsize=1024)
+def _count_statement(signature: tuple[str, ...], mode: CountMode):
+    where = [Property.owner_id == bindparam("owner_id"), *PROPERTY_FILTERS.conditions(signature)]
+    if mode == "exact":
+        return select(func.count()).select_from(Property).where(*where)
+
+    matching = select(Property.id).where(*where)
+    if mode == "capped":
+        # the index scan stops after count_limit rows
+        return select(func.count()).select_from(matching.limit(bindparam("count_limit", type_=Integer)).subquery())
+    return matching  # estimated: only EXPLAINed
+
+
+async def _count_matching(
+    db: AsyncSession, owner_id: int, signature: tuple[str, ...], params: dict, mode: CountMode
+) -> tuple[int, bool]:
+    """(count, exact) of the owner's listings matching the filters; no listing rows are fetched."""
+    params = {"owner_id": owner_id, **params}
+
+    if mode == "estimated":
+        estimate = await estimate_rows(db, _count_statement(signature, "estimated"), params)
+        if estimate > SEARCH_COUNT_CAP:
+            return estimate, False
+        mode = "capped"
+
+    if mode == "capped":
+        stmt = _count_statement(signature, "capped")
+        count = (await db.execute(stmt, {**params, "count_limit": SEARCH_COUNT_CAP + 1})).scalar_one()
+        return min(count, SEARCH_COUNT_CAP), count <= SEARCH_COUNT_CAP
+
+    return (await db.execute(_count_statement(signature, "exact"), params)).scalar_one(), True
+
+
+@lru_cache(maxsize=1024)
+def _exists_statement(signature: tuple[str, ...]):
+    return select(exists().where(Property.owner_id == bindparam("owner_id"), *PROPERTY_FILTERS.conditions(signature)))
+
+
+@lru_cache(maxsize=1024)
+def _search_statement(
+    signature: tuple[str, ...], sort: str, fields: tuple[str, ...], has_cursor: bool, has_limit: bool
+):
+    """Built once per request shape; returns (statement, keyset key types)."""
+    projection = _projection(fields)
+    stmt = select(*projection.columns).where(
+        Property.owner_id == bindparam("owner_id"), *PROPERTY_FILTERS.conditions(signature)
     )
-    return list(res.scalars().all())
+
+    # id is always the last key: it breaks ties so the order is stable between pages
+    descending = True
+    if sort == "newest":
+        keys = [Property.id]
+    elif sort == "relevance":
+        keys = [func.ts_rank(Property.search_vector, SEARCH_TSQUERY), Property.id]
+    else:
+        name, direction = sort.rsplit("_", 1)
+        descending = direction == "desc"
+        keys = [sort_key(SORT_COLUMNS[name], descending), Property.id]
+
+    stmt = keyset_template(stmt.add_columns(*keys), keys, has_cursor, has_limit, descending=descending)
+    return stmt, tuple(k.type for k in keys)
 
 
 # ⚠️ /search ყოველთვის იყოს /{property_id}-ზე ზემოთ
 @router.get("/search", response_model=list[PropertyResponse])
 async def search_properties(
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
+    filters: SearchFilters = Depends(search_filters),
+    projection: PropertyProjection = Depends(property_fields),
+
+    sort: SearchSort | None = Query(
+        default=None,
+        description="default: relevance when q is given, else newest; prices sort on price_base, missing values last",
+    ),
+
+    # Pagination (opt-in)
+    limit: int | None = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = Query(default=None, description="next_cursor from previous page (same sort)"),
+    total: CountMode | None = Query(default=None, description=TOTAL_DESCRIPTION),
+):
+    # min_price/max_price may be converted with the current exchange rates
+    etag = await properties_etag(db, current_user.id, with_rates=True)
+    cached = not_modified(request, response, etag)
+    if cached:
+        return cached
+
+    if sort is None:
+        sort = "relevance" if filters.tsquery is not None else "newest"
+    if sort == "relevance" and filters.tsquery is None:
+        raise HTTPException(status_code=400, detail="sort=relevance requires q")
+
+    # the ETag is part of the key, so an entry can never outlive the data it was built from
+    search_cache = get_search_cache()
+    cache_key = search_cache_key(current_user.id, etag, [
+        filters.signature, sorted(filters.params.items()), sort, limit, cursor, projection.encoder.fields, total,
+    ])
+    page = await search_cache.get(current_user.id, cache_key)
+    if page is not None:
+        return _json_page(response, page)
+
+    # only the parameter values differ between requests of the same shape
+    stmt, key_types = _search_statement(
+        filters.signature, sort, tuple(projection.encoder.fields), bool(cursor), limit is not None
+    )
+    params = {"owner_id": current_user.id, **filters.params, **keyset_params(cursor, key_types, limit)}
+
+    res = await db.execute(stmt, params)
+    rows, next_cursor = split_page(list(res.all()), limit, lambda row: row[len(projection.columns):])
+
+    page = {"body": projection.encoder.encode(rows).decode("utf-8"), "next_cursor": next_cursor}
+    if total is not None:
+        page["total"] = await _count_matching(db, current_user.id, filters.signature, filters.params, total)
+    await search_cache.set(current_user.id, cache_key, page)
+    return _json_page(response, page)
+
+
+@router.get("/search/count", response_model=PropertyCountResponse)
+async def count_search_results(
+    request: Request,
+    response: Response,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db),
+    filters: SearchFilters = Depends(search_filters),
+    mode: CountMode = Query(default="exact", description=COUNT_MODE_DESCRIPTION),
+):
+    """Number of listings /search would return for the same filters, without fetching them."""
+    etag = await properties_etag(db, current_user.id, with_rates=True)
+    cached = not_modified(request, response, etag)
+    if cached:
+        return cached
 
-    # Basic Filters
-    transaction_type: str | None = Query(default=None),
-    city: str | None = Query(default=None),
-    district: str | None = Query(default=None),
-    street: str | None = Query(default=None),
+    count, exact = await _count_matching(db, current_user.id, filters.signature, filters.params, mode)
+    return PropertyCountResponse(count=count, exact=exact)
 
-    currency: str | None = Query(default=None),
-    min_price: float | None = Query(default=None),
-    max_price: float | None = Query(default=None),
 
-    min_area: float | None = Query(default=None),
-    max_area: float | None = Query(default=None),
+@router.get("/search/exists", response_model=PropertyExistsResponse)
+async def search_results_exist(
+    request: Request,
+    response: Response,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db),
+    filters: SearchFilters = Depends(search_filters),
+):
+    """Whether /search would return anything for the same filters: stops at the first match."""
+    etag = await properties_etag(db, current_user.id, with_rates=True)
+    cached = not_modified(request, response, etag)
+    if cached:
+        return cached
+
+    stmt = _exists_statement(filters.signature)
+    found = (await db.execute(stmt, {"owner_id": current_user.id, **filters.params})).scalar_one()
+    return PropertyExistsResponse(exists=found)
+
+
+@router.get("/facets", response_model=PropertyFacetsResponse)
+async def property_facets(
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db),
+    filters: SearchFilters = Depends(search_filters),
+    price_bucket: float = Query(
+        default=50000, gt=0, allow_inf_nan=False, description=f"price histogram bucket width ({BASE_CURRENCY})"
+    ),
+    area_bucket: float = Query(default=25, gt=0, allow_inf_nan=False, description="area histogram bucket width (m²)"),
+):
+    """
+    Counts per facet value plus price/area histograms for the same filter set as /search,
+    computed by one GROUPING SETS query.
+    """
+    # bucket widths are inlined (validated floats): the same expression must appear
+    # in SELECT and GROUP BY, which separate bind parameters would break
+    price_bin = func.floor(Property.price_base / literal_column(repr(price_bucket))) * literal_column(repr(price_bucket))
+    area_bin = func.floor(Property.area_sqm / literal_column(repr(area_bucket))) * literal_column(repr(area_bucket))
+
+    dims = [getattr(Property, f) for f in FACET_FIELDS] + [price_bin, area_bin]
+    stmt = (
+        select(func.grouping(*dims), *dims, func.count())
+        .where(Property.owner_id == current_user.id, *filters.conditions)
+        .group_by(func.grouping_sets(*[tuple_(d) for d in dims], tuple_()))
+    )
+    res = await db.execute(stmt, filters.params)
+
+    # GROUPING(...) is a bitmask with a 1 for every dimension NOT grouped in that row
+    all_bits = (1 << len(dims)) - 1
+    set_by_mask = {all_bits ^ (1 << (len(dims) - 1 - i)): i for i in range(len(dims))}
+
+    total = 0
+    facets: dict[str, list[FacetValue]] = {f: [] for f in FACET_FIELDS}
+    price_histogram: list[HistogramBucket] = []
+    area_histogram: list[HistogramBucket] = []
+
+    for mask, *values, count in res.all():
+        if mask == all_bits:
+            total = count
+            continue
+
+        i = set_by_mask[mask]
+        value = values[i]
+        if i < len(FACET_FIELDS):
+            facets[FACET_FIELDS[i]].append(FacetValue(value=value, count=count))
+        elif value is not None:
+            width = price_bucket if i == len(FACET_FIELDS) else area_bucket
+            histogram = price_histogram if i == len(FACET_FIELDS) else area_histogram
+            histogram.append(HistogramBucket(min=value, max=value + width, count=count))
+
+    for values in facets.values():
+        values.sort(key=lambda v: (-v.count, v.value is None, v.value or ""))
+    price_histogram.sort(key=lambda b: b.min)
+    area_histogram.sort(key=lambda b: b.min)
+
+    return PropertyFacetsResponse(
+        total=total,
+        facets=facets,
+        price_histogram=price_histogram,
+        area_histogram=area_histogram,
+    )
 
-    rooms: int | None = Query(default=None),
-    bedrooms: int | None = Query(default=None),
-    bathrooms: int | None = Query(default=None),
 
-    floor: int | None = Query(default=None),
-    total_floors: int | None = Query(default=None),
-    not_first_floor: bool | None = Query(default=None),
+def _owned(owner_id: int, ids: list[int]) -> list[ColumnElement]:
+    # one array parameter (id = ANY(:ids)) instead of an IN list per batch size
+    return [Property.id == any_(bindparam("ids", ids, type_=ARRAY(Integer))), Property.owner_id == owner_id]
 
-    condition: str | None = Query(default=None),
 
-    # Comfort / Infrastructure
-    building_type: str | None = Query(default=None),
-    heating_type: str | None = Query(default=None),
-    has_air_conditioning: bool | None = Query(default=None),
+def _batch_results(ids: list[int], affected: set[int], status: str) -> PropertyBatchResponse:
+    ids = list(dict.fromkeys(ids))
+    return PropertyBatchResponse(
+        affected=len(affected),
+        results=[BatchItemResult(id=i, status=status if i in affected else "not_found") for i in ids],
+    )
 
-    parking_type: str | None = Query(default=None),
-    has_balcony: bool | None = Query(default=None),
-    pets_allowed: bool | None = Query(default=None),
-    furnished: str | None = Query(default=None),
 
-    q: str | None = Query(default=None, description="search in title"),
+# ⚠️ /batch routes stay above /{property_id}
+@router.patch("/batch", response_model=PropertyBatchResponse)
+async def batch_update_properties(
+    payload: PropertyBatchUpdate,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
 ):
-    stmt = select(Property).where(Property.owner_id == current_user.id)
-
-    if transaction_type:
-        stmt = stmt.where(Property.transaction_type == transaction_type)
-
-    if city:
-        stmt = stmt.where(Property.city.ilike(f"%{city}%"))
-    if district:
-        stmt = stmt.where(Property.district.ilike(f"%{district}%"))
-    if street:
-        stmt = stmt.where(Property.street.ilike(f"%{street}%"))
-
-    if currency:
-        stmt = stmt.where(Property.currency == currency)
-
-    if min_price is not None:
-        stmt = stmt.where(Property.price >= min_price)
-    if max_price is not None:
-        stmt = stmt.where(Property.price <= max_price)
-
-    if min_area is not None:
-        stmt = stmt.where(Property.area_sqm >= min_area)
-    if max_area is not None:
-        stmt = stmt.where(Property.area_sqm <= max_area)
-
-    if rooms is not None:
-        stmt = stmt.where(Property.rooms == rooms)
-    if bedrooms is not None:
-        stmt = stmt.where(Property.bedrooms == bedrooms)
-    if bathrooms is not None:
-        stmt = stmt.where(Property.bathrooms == bathrooms)
-
-    if floor is not None:
-        stmt = stmt.where(Property.floor == floor)
-    if total_floors is not None:
-        stmt = stmt.where(Property.total_floors == total_floors)
-
-    if not_first_floor is not None:
-        stmt = stmt.where(Property.not_first_floor == not_first_floor)
-
-    if condition:
-        stmt = stmt.where(Property.condition == condition)
-
-    # Comfort filters
-    if building_type:
-        stmt = stmt.where(Property.building_type == building_type)
-    if heating_type:
-        stmt = stmt.where(Property.heating_type == heating_type)
-    if has_air_conditioning is not None:
-        stmt = stmt.where(Property.has_air_conditioning == has_air_conditioning)
-
-    if parking_type:
-        stmt = stmt.where(Property.parking_type == parking_type)
-    if has_balcony is not None:
-        stmt = stmt.where(Property.has_balcony == has_balcony)
-    if pets_allowed is not None:
-        stmt = stmt.where(Property.pets_allowed == pets_allowed)
-    if furnished:
-        stmt = stmt.where(Property.furnished == furnished)
-
-    if q:
-        stmt = stmt.where(Property.title.ilike(f"%{q}%"))
-
-    stmt = stmt.order_by(Property.id.desc())
+    """Apply the same partial update to many listings with one UPDATE ... RETURNING."""
+    changes = payload.changes.model_dump(exclude_unset=True)
+    if not changes:
+        raise HTTPException(status_code=400, detail="No changes given")
 
-    res = await db.execute(stmt)
-    return list(res.scalars().all())
+    res = await db.execute(
+        update(Property)
+        .where(*_owned(current_user.id, payload.ids))
+        .values(**changes)
+        .returning(Property.id)
+        .execution_options(synchronize_session=False)
+    )
+    affected = set(res.scalars().all())
+    await db.commit()
+    if affected:
+        await _after_write(current_user.id)
+    return _batch_results(payload.ids, affected, "updated")
+
+
+@router.delete("/batch", response_model=PropertyBatchResponse)
+async def batch_delete_properties(
+    payload: PropertyBatchDelete,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Delete many listings with one DELETE ... RETURNING."""
+    res = await db.execute(
+        delete(Property)
+        .where(*_owned(current_user.id, payload.ids))
+        .returning(Property.id)
+        .execution_options(synchronize_session=False)
+    )
+    affected = set(res.scalars().all())
+    await db.commit()
+    if affected:
+        await _after_write(current_user.id)
+    return _batch_results(payload.ids, affected, "deleted")
 
 
 @router.get("/{property_id}", response_model=PropertyResponse)
 async def get_property(
     property_id: int,
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
+    projection: PropertyProjection = Depends(property_fields),
 ):
+    etag = await properties_etag(db, current_user.id)
+    cached = not_modified(request, response, etag)
+    if cached:
+        return cached
+
     res = await db.execute(
-        select(Property).where(
+        select(*projection.columns).where(
             Property.id == property_id,
             Property.owner_id == current_user.id,
         )
     )
-    prop = res.scalar_one_or_none()
-    if not prop:
+    row = res.one_or_none()
+    if not row:
         raise HTTPException(status_code=404, detail="Property not found")
-    return prop
+    return _json_response(response, projection.encoder.encode_row(row))
 
 
 @router.put("/{property_id}", response_model=PropertyResponse)
 async def update_property(
     property_id: int,
     payload: PropertyCreate,
+    response: Response,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    res = await db.execute(
-        select(Property).where(
+    projection = _projection(PROPERTY_FIELDS)
+
+    # Update fields (PUT = სრულად განახლება იმ მონაცემებით, რასაც აგზავნი)
+    stmt = (
+        update(Property)
+        .where(
             Property.id == property_id,
             Property.owner_id == current_user.id,
         )
+        .values(**_column_values(payload))
+        .returning(*projection.columns)
+        .execution_options(synchronize_session=False)
     )
-    prop = res.scalar_one_or_none()
-    if not prop:
-        raise HTTPException(status_code=404, detail="Property not found")
 
-    # Update fields (PUT = სრულად განახლება იმ მონაცემებით, რასაც აგზავნი)
-    prop.title = payload.title.strip()
-    prop.description = payload.description
-
-    prop.transaction_type = payload.transaction_type
-    prop.city = payload.city
-    prop.district = payload.district
-    prop.street = payload.street
-    prop.currency = payload.currency
-    prop.price = payload.price
-    prop.area_sqm = payload.area_sqm
-    prop.rooms = payload.rooms
-    prop.bedrooms = payload.bedrooms
-    prop.bathrooms = payload.bathrooms
-    prop.floor = payload.floor
-    prop.total_floors = payload.total_floors
-    prop.not_first_floor = payload.not_first_floor
-    prop.condition = payload.condition
-
-    prop.building_type = payload.building_type
-    prop.heating_type = payload.heating_type
-    prop.has_air_conditioning = payload.has_air_conditioning
-    prop.parking_type = payload.parking_type
-    prop.has_balcony = payload.has_balcony
-    prop.pets_allowed = payload.pets_allowed
-    prop.furnished = payload.furnished
+    # one UPDATE ... RETURNING; no row = missing or not yours
+    row = (await db.execute(stmt)).one_or_none()
+    if not row:
+        raise HTTPException(status_code=404, detail="Property not found")
 
     await db.commit()
-    await db.refresh(prop)
-    return prop
+    await _after_write(current_user.id)
+    return _json_response(response, projection.encoder.encode_row(row))
+
+
+@router.patch("/{property_id}", response_model=PropertyResponse)
+async def patch_property(
+    property_id: int,
+    payload: PropertyUpdate,
+    response: Response,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Partial update: only the fields sent are changed, in one UPDATE ... RETURNING."""
+    projection = _projection(PROPERTY_FIELDS)
+    where = [Property.id == property_id, Property.owner_id == current_user.id]
+    changes = payload.model_dump(exclude_unset=True)
+
+    if changes:
+        stmt = (
+            update(Property)
+            .where(*where)
+            .values(**changes)
+            .returning(*projection.columns)
+            .execution_options(synchronize_session=False)
+        )
+    else:
+        stmt = select(*projection.columns).where(*where)
+
+    row = (await db.execute(stmt)).one_or_none()
+    if not row:
+        raise HTTPException(status_code=404, detail="Property not found")
+
+    if changes:
+        await db.commit()
+        await _after_write(current_user.id)
+    return _json_response(response, projection.encoder.encode_row(row))
 
 
 @router.delete("/{property_id}", status_code=204)
@@ -251,16 +707,19 @@ async def delete_property(
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
+    # one DELETE ... RETURNING; no row = missing or not yours
     res = await db.execute(
-        select(Property).where(
+        delete(Property)
+        .where(
             Property.id == property_id,
             Property.owner_id == current_user.id,
         )
+        .returning(Property.id)
+        .execution_options(synchronize_session=False)
     )
-    prop = res.scalar_one_or_none()
-    if not prop:
+    if res.scalar_one_or_none() is None:
         raise HTTPException(status_code=404, detail="Property not found")
 
-    await db.delete(prop)   # ✅ ეს იყო მთავარი
     await db.commit()
+    await _after_write(current_user.id)
     return None
@@ -4,7 +4,8 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.security import decode_access_token
-from app.db.session import get_db
+from app.core.user_cache import get_cached_user, cache_user
+from app.db.session import get_db, replica_sessionmaker_for
 from app.models.user import User
 from app.schemas.user import UserMeResponse
 
@@ -12,10 +13,9 @@ router = APIRouter(prefix="/users", tags=["users"])
 bearer = HTTPBearer(auto_error=False)
 
 
-async def get_current_user(
+async def get_token_user_id(
     creds: HTTPAuthorizationCredentials | None = Depends(bearer),
-    db: AsyncSession = Depends(get_db),
-) -> User:
+) -> int:
     if creds is None or not creds.credentials:
         raise HTTPException(status_code=401, detail="Missing bearer token")
 
@@ -30,11 +30,41 @@ async def get_current_user(
     except ValueError:
         raise HTTPException(status_code=401, detail="Invalid token subject")
 
+    return user_id
+
+
+async def get_read_db(
+    user_id: int = Depends(get_token_user_id),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Session for read-only handlers: a replica when configured, otherwise (or right
+    after this user wrote something) the request's primary session.
+    """
+    maker = await replica_sessionmaker_for(user_id)
+    if maker is None:
+        yield db
+        return
+
+    async with maker() as session:
+        yield session
+
+
+async def get_current_user(
+    user_id: int = Depends(get_token_user_id),
+    db: AsyncSession = Depends(get_read_db),
+) -> User:
+    # cached user record saves a users SELECT on every protected request
+    user = await get_cached_user(user_id)
+    if user is not None:
+        return user
+
     res = await db.execute(select(User).where(User.id == user_id))
     user = res.scalar_one_or_none()
     if not user:
         raise HTTPException(status_code=401, detail="User not found")
 
+    await cache_user(user)
     return user
 
 
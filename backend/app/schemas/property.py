@@ -1,5 +1,9 @@
-from pydantic import BaseModel
-from typing import Optional
+from functools import lru_cache
+
+from pydantic import BaseModel, ConfigDict, Field, create_model, field_validator
+from typing import Literal, Optional
+
+from app.core.config import BATCH_MAX_IDS
 
 
 class PropertyCreate(BaseModel):
@@ -13,6 +17,9 @@ class PropertyCreate(BaseModel):
     district: Optional[str] = None
     street: Optional[str] = None
 
+    lat: Optional[float] = Field(default=None, ge=-90, le=90)
+    lon: Optional[float] = Field(default=None, ge=-180, le=180)
+
     currency: Optional[str] = None  # GEL / USD
     price: Optional[float] = None
 
@@ -42,6 +49,38 @@ class PropertyCreate(BaseModel):
     description: Optional[str] = None
 
 
+class PropertyUpdate(PropertyCreate):
+    """PATCH body: only the fields present in the request are changed (exclude_unset)."""
+    title: Optional[str] = None
+
+    @field_validator("title")
+    @classmethod
+    def title_not_null(cls, v):
+        # only runs when title is sent; the column is NOT NULL
+        if v is None:
+            raise ValueError("title cannot be null")
+        return v.strip()
+
+
+class PropertyBatchUpdate(BaseModel):
+    ids: list[int] = Field(min_length=1, max_length=BATCH_MAX_IDS)
+    changes: PropertyUpdate
+
+
+class PropertyBatchDelete(BaseModel):
+    ids: list[int] = Field(min_length=1, max_length=BATCH_MAX_IDS)
+
+
+class BatchItemResult(BaseModel):
+    id: int
+    status: Literal["updated", "deleted", "not_found"]  # not_found = missing or not yours
+
+
+class PropertyBatchResponse(BaseModel):
+    affected: int
+    results: list[BatchItemResult]  # one per distinct id, in request order
+
+
 class PropertyResponse(BaseModel):
     id: int
 
@@ -53,10 +92,14 @@ class PropertyResponse(BaseModel):
     district: Optional[str] = None
     street: Optional[str] = None
 
+    lat: Optional[float] = None
+    lon: Optional[float] = None
+
     currency: Optional[str] = None
     price: Optional[float] = None
 
     area_sqm: Optional[float] = None
+    price_per_sqm: Optional[float] = None  # in BASE_CURRENCY, computed by the database
 
     rooms: Optional[int] = None
     bedrooms: Optional[int] = None
@@ -84,3 +127,53 @@ class PropertyResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+@lru_cache(maxsize=256)
+def property_response_model(fields: tuple[str, ...]) -> type[BaseModel]:
+    """PropertyResponse restricted to `fields` (in PropertyResponse order), for ?fields= projections."""
+    if fields == tuple(PropertyResponse.model_fields):
+        return PropertyResponse
+    return create_model(
+        "PropertyResponsePartial",
+        __config__=ConfigDict(from_attributes=True),
+        **{f: (info.annotation, info) for f, info in PropertyResponse.model_fields.items() if f in fields},
+    )
+
+
+class BulkRowErrorResponse(BaseModel):
+    row: int
+    errors: list[str]
+
+
+class BulkImportResponse(BaseModel):
+    inserted: int
+    failed: int
+    errors: list[BulkRowErrorResponse]  # capped at BULK_MAX_ERRORS, see `failed` for the total
+
+
+class FacetValue(BaseModel):
+    value: Optional[str] = None  # None = not specified on the listing
+    count: int
+
+
+class HistogramBucket(BaseModel):
+    min: float  # inclusive
+    max: float  # exclusive
+    count: int
+
+
+class PropertyFacetsResponse(BaseModel):
+    total: int
+    facets: dict[str, list[FacetValue]]
+    price_histogram: list[HistogramBucket]
+    area_histogram: list[HistogramBucket]
+
+
+class PropertyCountResponse(BaseModel):
+    count: int
+    exact: bool  # false when capped or estimated
+
+
+class PropertyExistsResponse(BaseModel):
+    exists: bool
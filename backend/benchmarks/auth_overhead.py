@@ -0,0 +1,77 @@
+"""
+Microbenchmark: access-token verification cost per authenticated request, no database or
+server needed. Each request checks its token twice (RateLimitMiddleware for the user
+bucket, then get_token_user_id).
+
+  * before -> full python-jose decode + signature check on every call
+  * after  -> decode_access_token: the verified-token cache answers after the first call
+
+Runs with HS256 (shared secret) and ES256 (throwaway P-256 key, what other services would
+verify through /.well-known/jwks.json).
+
+Usage (from backend/):
+    python benchmarks/auth_overhead.py --requests 5000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+from dotenv import load_dotenv
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+load_dotenv()
+
+from cryptography.hazmat.primitives import serialization  # noqa: E402
+from cryptography.hazmat.primitives.asymmetric import ec  # noqa: E402
+from jose import jwt  # noqa: E402
+
+from app.core import security  # noqa: E402
+from app.core.jwt_keys import KeySet, set_keys  # noqa: E402
+
+CHECKS_PER_REQUEST = 2
+
+
+def _es256_keys(directory: str) -> KeySet:
+    pem = ec.generate_private_key(ec.SECP256R1()).private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    )
+    path = os.path.join(directory, "jwt-es256.pem")
+    with open(path, "wb") as f:
+        f.write(pem)
+    return KeySet(alg="ES256", private_key_file=path, kid="bench")
+
+
+def _us_per_request(check, tokens: list[str], requests: int) -> float:
+    t0 = time.process_time()
+    for i in range(requests):
+        token = tokens[i % len(tokens)]
+        for _ in range(CHECKS_PER_REQUEST):
+            check(token)
+    return (time.process_time() - t0) / requests * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--users", type=int, default=100, help="distinct tokens in rotation")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        key_sets = {"HS256": KeySet(alg="HS256"), "ES256": _es256_keys(tmp)}
+
+        print(f"{'algorithm':<10} {'before us':>10} {'after us':>10} {'speedup':>8}   per request, {CHECKS_PER_REQUEST} checks")
+        for name, keys in key_sets.items():
+            set_keys(keys)
+            tokens = [security.create_access_token(str(i)) for i in range(args.users)]
+
+            def full_decode(token: str) -> dict:
+                return jwt.decode(token, keys.verification_key(keys.kid), algorithms=[keys.alg])
+
+            before = _us_per_request(full_decode, tokens, args.requests)
+            after = _us_per_request(security.decode_access_token, tokens, args.requests)
+            print(f"{name:<10} {before:>10.1f} {after:>10.1f} {before / after:>7.1f}x")
+
+
+main()
@@ -0,0 +1,154 @@
+"""
+EXPLAIN-based before/after benchmark for the /properties/search location filters.
+
+Seeds a throwaway owner with N listings scattered over Georgia (lat 41.0-43.6,
+lon 40.0-46.7) and runs the SQL that `near`/`radius_km` and `bbox` generate through
+EXPLAIN (ANALYZE, BUFFERS) twice:
+  * before -> inside a rolled-back transaction with ix_properties_location dropped
+  * after  -> with the GiST point(lon, lat) index in place
+
+Usage (from backend/, after `alembic upgrade head`):
+    python benchmarks/geo_search.py --rows 1000000
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+from dotenv import load_dotenv
+from sqlalchemy import select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import create_async_engine
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+load_dotenv()
+
+from app.core.geo import boxes_params, parse_bbox, radius_params, split_bbox, within_boxes, within_radius  # noqa: E402
+from app.models.property import Property  # noqa: E402
+
+BENCH_EMAIL = "bench-geo-search@example.com"
+
+SEED_SQL = """
+INSERT INTO properties (owner_id, title, transaction_type, lat, lon)
+SELECT
+    CAST(:owner_id AS integer),
+    'Geo listing ' || g,
+    (ARRAY['buy', 'rent', 'daily_rent'])[1 + g % 3],
+    41.0 + random() * 2.6,
+    40.0 + random() * 6.7
+FROM generate_series(1, :rows) AS g
+"""
+
+def _near(lat: float, lon: float, radius_km: float):
+    count, params = radius_params("near", lat, lon, radius_km)
+    return within_radius("near", count), params
+
+
+def _bbox(value: str):
+    boxes = split_bbox(parse_bbox(value))
+    return [within_boxes("bbox", len(boxes))], boxes_params("bbox", boxes)
+
+
+# (lat, lon, radius_km) around Tbilisi / Batumi, and a bbox over central Tbilisi
+QUERIES = {
+    "near Tbilisi, 1 km": lambda: _near(41.7151, 44.8271, 1),
+    "near Tbilisi, 5 km": lambda: _near(41.7151, 44.8271, 5),
+    "near Batumi, 25 km": lambda: _near(41.6168, 41.6367, 25),
+    "bbox central Tbilisi": lambda: _bbox("44.75,41.68,44.85,41.75"),
+}
+
+
+def _sql(owner_id: int, query) -> str:
+    conditions, params = query
+    stmt = select(Property.id).where(Property.owner_id == owner_id, *conditions).params(**params)
+    return str(stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+def _plan_summary(plan: dict) -> tuple[float, int, str]:
+    indexes = set()
+
+    def walk(node: dict):
+        if node.get("Index Name"):
+            indexes.add(node["Index Name"])
+        for child in node.get("Plans", []):
+            walk(child)
+
+    walk(plan["Plan"])
+    used = ", ".join(sorted(indexes)) or "-"
+    return plan["Execution Time"], plan["Plan"]["Actual Rows"], f'{plan["Plan"]["Node Type"]} [{used}]'
+
+
+async def _explain_all(conn, owner_id: int) -> dict[str, tuple[float, int, str]]:
+    out = {}
+    for name, conditions in QUERIES.items():
+        res = await conn.execute(text("EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) " + _sql(owner_id, conditions())))
+        raw = res.scalar_one()
+        plan = (json.loads(raw) if isinstance(raw, str) else raw)[0]
+        out[name] = _plan_summary(plan)
+    return out
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--keep", action="store_true", help="keep the seeded rows for further runs")
+    args = parser.parse_args()
+
+    url = os.getenv("DATABASE_URL")
+    if not url:
+        raise SystemExit("DATABASE_URL not found in .env")
+
+    engine = create_async_engine(url, echo=False)
+
+    async with engine.begin() as conn:
+        owner_id = (await conn.execute(
+            text("SELECT id FROM users WHERE email = :email"), {"email": BENCH_EMAIL}
+        )).scalar_one_or_none()
+
+        if owner_id is None:
+            owner_id = (await conn.execute(
+                text(
+                    "INSERT INTO users (email, hashed_password, role, full_name) "
+                    "VALUES (:email, '!', 'agent', 'Geo benchmark') RETURNING id"
+                ),
+                {"email": BENCH_EMAIL},
+            )).scalar_one()
+
+        existing = (await conn.execute(
+            text("SELECT count(*) FROM properties WHERE owner_id = :owner_id"), {"owner_id": owner_id}
+        )).scalar_one()
+
+        if existing < args.rows:
+            t0 = time.perf_counter()
+            await conn.execute(text(SEED_SQL), {"owner_id": owner_id, "rows": args.rows - existing})
+            print(f"seeded {args.rows - existing} rows in {time.perf_counter() - t0:.1f}s")
+
+    async with engine.connect() as conn:
+        await conn.execute(text("ANALYZE properties"))
+        await conn.commit()
+
+        after = await _explain_all(conn, owner_id)
+        await conn.commit()
+
+        trans = await conn.begin()
+        await conn.execute(text("DROP INDEX ix_properties_location"))
+        before = await _explain_all(conn, owner_id)
+        await trans.rollback()
+
+    print(f"\n{'query':<24} {'rows':>7} {'before ms':>10} {'after ms':>10} {'speedup':>8}  plan (before -> after)")
+    for name in QUERIES:
+        b_ms, _, b_plan = before[name]
+        a_ms, rows, a_plan = after[name]
+        print(f"{name:<24} {rows:>7} {b_ms:>10.2f} {a_ms:>10.2f} {b_ms / max(a_ms, 0.001):>7.1f}x  {b_plan} -> {a_plan}")
+
+    if not args.keep:
+        async with engine.begin() as conn:
+            await conn.execute(text("DELETE FROM properties WHERE owner_id = :owner_id"), {"owner_id": owner_id})
+            await conn.execute(text("DELETE FROM users WHERE id = :owner_id"), {"owner_id": owner_id})
+
+    await engine.dispose()
+
+
+asyncio.run(main())
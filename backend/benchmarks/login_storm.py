@@ -0,0 +1,97 @@
+"""
+Login-storm load test: p50/p99 latency of /health and GET /properties
+with and without N concurrent clients hammering /auth/login (bcrypt-bound).
+
+With bcrypt on the event loop the probes stall for the whole storm;
+with the bcrypt pool they should stay flat.
+
+Start the API first with rate limiting off, since storm and probes share one client IP
+(RATE_LIMIT_ENABLED=false uvicorn app.main:app), then:
+    python benchmarks/login_storm.py --base-url http://127.0.0.1:8000 --storm 50 --seconds 10
+
+Requires httpx (pip install httpx).
+"""
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+
+import httpx
+
+PASSWORD = "storm-password"
+
+
+def _pct(samples: list[float], p: float) -> float:
+    if not samples:
+        return 0.0
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(round(p / 100 * (len(samples) - 1))))]
+
+
+async def _probe(client: httpx.AsyncClient, headers: dict, stop: asyncio.Event, out: dict):
+    while not stop.is_set():
+        for name, url, hdrs in (("/health", "/health", {}), ("GET /properties", "/properties?limit=20", headers)):
+            t0 = time.perf_counter()
+            r = await client.get(url, headers=hdrs)
+            r.raise_for_status()
+            out.setdefault(name, []).append((time.perf_counter() - t0) * 1000)
+        await asyncio.sleep(0.02)
+
+
+async def _storm(client: httpx.AsyncClient, email: str, stop: asyncio.Event, codes: dict):
+    while not stop.is_set():
+        r = await client.post("/auth/login", json={"email": email, "password": PASSWORD})
+        codes[r.status_code] = codes.get(r.status_code, 0) + 1
+
+
+async def _phase(client, headers, email, storm: int, seconds: float):
+    stop = asyncio.Event()
+    latencies: dict[str, list[float]] = {}
+    codes: dict[int, int] = {}
+
+    tasks = [asyncio.create_task(_probe(client, headers, stop, latencies))]
+    tasks += [asyncio.create_task(_storm(client, email, stop, codes)) for _ in range(storm)]
+
+    await asyncio.sleep(seconds)
+    stop.set()
+    await asyncio.gather(*tasks)
+    return latencies, codes
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--storm", type=int, default=50, help="concurrent login clients")
+    parser.add_argument("--seconds", type=float, default=10)
+    args = parser.parse_args()
+
+    limits = httpx.Limits(max_connections=args.storm + 10)
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=60, limits=limits) as client:
+        email = f"storm-{uuid.uuid4().hex[:8]}@example.com"
+        r = await client.post(
+            "/auth/register", json={"email": email, "password": PASSWORD, "full_name": "Login storm"}
+        )
+        r.raise_for_status()
+        headers = {"Authorization": f"Bearer {r.json()['access_token']}"}
+        for i in range(20):
+            await client.post("/properties", json={"title": f"Storm listing {i}"}, headers=headers)
+
+        results = {}
+        for label, storm in (("idle", 0), (f"storm x{args.storm}", args.storm)):
+            results[label] = await _phase(client, headers, email, storm, args.seconds)
+
+    print(f"\n{'phase':<14} {'endpoint':<18} {'n':>6} {'p50 ms':>8} {'p99 ms':>8} {'max ms':>8}")
+    for label, (latencies, codes) in results.items():
+        for name, samples in latencies.items():
+            print(
+                f"{label:<14} {name:<18} {len(samples):>6} {statistics.median(samples):>8.1f} "
+                f"{_pct(samples, 99):>8.1f} {max(samples):>8.1f}"
+            )
+        if codes:
+            logins = sum(codes.values())
+            print(f"{label:<14} {'/auth/login':<18} {logins:>6} "
+                  f"({logins / args.seconds:.1f}/s, status codes: {dict(sorted(codes.items()))})")
+
+
+asyncio.run(main())
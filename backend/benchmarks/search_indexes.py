@@ -0,0 +1,169 @@
+"""
+EXPLAIN-based before/after benchmark for the properties search indexes.
+
+Seeds a throwaway owner with N synthetic listings in a local Postgres, then runs
+the typical /properties/search predicates through EXPLAIN (ANALYZE, BUFFERS) twice:
+  * before -> inside a rolled-back transaction with the search indexes dropped
+              (only the baseline pkey / id / owner_id indexes remain)
+  * after  -> with every index from the migrations in place
+
+Usage (from backend/, after `alembic upgrade head`):
+    python benchmarks/search_indexes.py --rows 200000
+"""
+import argparse
+import asyncio
+import json
+import os
+import time
+
+from dotenv import load_dotenv
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+load_dotenv()
+
+BENCH_EMAIL = "bench-search-indexes@wisekey.local"
+BASELINE_INDEXES = {"properties_pkey", "ix_properties_id", "ix_properties_owner_id"}
+
+SEED_SQL = """
+INSERT INTO properties (
+    owner_id, title, description, transaction_type, city, district, street,
+    currency, price, area_sqm, rooms, bedrooms, bathrooms, floor, total_floors,
+    condition, has_balcony, has_air_conditioning, pets_allowed
+)
+SELECT
+    CAST(:owner_id AS integer),
+    'Listing ' || g || ' ' || (ARRAY['Vake apartment', 'Saburtalo flat', 'Old Tbilisi house', 'Seaside studio'])[1 + g % 4],
+    'Synthetic listing #' || g,
+    (ARRAY['buy', 'rent', 'daily_rent'])[1 + g % 3],
+    (ARRAY['Tbilisi', 'Batumi', 'Kutaisi', 'Rustavi', 'Gori'])[1 + g % 5],
+    'District ' || (g % 40),
+    'Street ' || (g % 700),
+    (ARRAY['GEL', 'USD'])[1 + g % 2],
+    round((random() * 400000)::numeric)::float,
+    round((20 + random() * 230)::numeric, 1)::float,
+    1 + g % 6,
+    g % 4,
+    1 + g % 3,
+    1 + g % 20,
+    20,
+    (ARRAY['black_frame', 'white_frame', 'green_frame', 'old_renov', 'new_renov'])[1 + g % 5],
+    g % 2 = 0,
+    g % 3 = 0,
+    g % 5 = 0
+FROM generate_series(1, :rows) AS g
+"""
+
+QUERIES = {
+    "list page (keyset)": "ORDER BY id DESC LIMIT 51",
+    "transaction_type + price range": "AND transaction_type = 'rent' AND price_base BETWEEN 1000 AND 1500",
+    "currency + price range": "AND currency = 'USD' AND price_base >= 390000",
+    "transaction_type + rooms": "AND transaction_type = 'buy' AND rooms = 5",
+    "price_base range": "AND price_base BETWEEN 2000 AND 2100",
+    "area range": "AND area_sqm BETWEEN 240 AND 245",
+    "comfort flags": "AND has_balcony AND has_air_conditioning AND pets_allowed",
+    "city ilike": "AND city ILIKE '%kutai%'",
+    "district ilike": "AND district ILIKE '%ict 17%'",
+    "street ilike": "AND street ILIKE '%eet 123%'",
+    "q full-text": "AND search_vector @@ websearch_to_tsquery('wisekey', 'seaside') LIMIT 50",
+}
+
+
+def _plan_summary(plan: dict) -> tuple[float, str]:
+    indexes = set()
+
+    def walk(node: dict):
+        if node.get("Index Name"):
+            indexes.add(node["Index Name"])
+        for child in node.get("Plans", []):
+            walk(child)
+
+    walk(plan["Plan"])
+    used = ", ".join(sorted(indexes)) or "-"
+    return plan["Execution Time"], f'{plan["Plan"]["Node Type"]} [{used}]'
+
+
+async def _explain_all(conn, owner_id: int) -> dict[str, tuple[float, str]]:
+    out = {}
+    for name, tail in QUERIES.items():
+        sql = f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) SELECT * FROM properties WHERE owner_id = {owner_id} {tail}"
+        res = await conn.execute(text(sql))
+        raw = res.scalar_one()
+        plan = (json.loads(raw) if isinstance(raw, str) else raw)[0]
+        out[name] = _plan_summary(plan)
+    return out
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--keep", action="store_true", help="keep the seeded rows for further runs")
+    args = parser.parse_args()
+
+    url = os.getenv("DATABASE_URL")
+    if not url:
+        raise SystemExit("DATABASE_URL not found in .env")
+
+    engine = create_async_engine(url, echo=False)
+
+    async with engine.begin() as conn:
+        owner_id = (await conn.execute(
+            text("SELECT id FROM users WHERE email = :email"), {"email": BENCH_EMAIL}
+        )).scalar_one_or_none()
+
+        if owner_id is None:
+            owner_id = (await conn.execute(
+                text(
+                    "INSERT INTO users (email, hashed_password, role, full_name) "
+                    "VALUES (:email, '!', 'agent', 'Index benchmark') RETURNING id"
+                ),
+                {"email": BENCH_EMAIL},
+            )).scalar_one()
+
+        existing = (await conn.execute(
+            text("SELECT count(*) FROM properties WHERE owner_id = :owner_id"), {"owner_id": owner_id}
+        )).scalar_one()
+
+        # USD rows need a rate or their price_base stays NULL
+        await conn.execute(text(
+            "INSERT INTO exchange_rates (currency, rate_to_base) VALUES ('USD', 2.7) ON CONFLICT DO NOTHING"
+        ))
+
+        if existing < args.rows:
+            t0 = time.perf_counter()
+            await conn.execute(text(SEED_SQL), {"owner_id": owner_id, "rows": args.rows - existing})
+            print(f"seeded {args.rows - existing} rows in {time.perf_counter() - t0:.1f}s")
+
+    async with engine.connect() as conn:
+        await conn.execute(text("ANALYZE properties"))
+        await conn.commit()
+
+        after = await _explain_all(conn, owner_id)
+        await conn.commit()
+
+        # "before": drop everything but the baseline indexes, measure, roll back
+        trans = await conn.begin()
+        names = (await conn.execute(
+            text("SELECT indexname FROM pg_indexes WHERE tablename = 'properties'")
+        )).scalars().all()
+        for name in names:
+            if name not in BASELINE_INDEXES:
+                await conn.execute(text(f'DROP INDEX "{name}"'))
+        before = await _explain_all(conn, owner_id)
+        await trans.rollback()
+
+    print(f"\n{'query':<32} {'before ms':>10} {'after ms':>10} {'speedup':>8}  plan (before -> after)")
+    for name in QUERIES:
+        b_ms, b_plan = before[name]
+        a_ms, a_plan = after[name]
+        print(f"{name:<32} {b_ms:>10.2f} {a_ms:>10.2f} {b_ms / max(a_ms, 0.001):>7.1f}x  {b_plan} -> {a_plan}")
+
+    if not args.keep:
+        async with engine.begin() as conn:
+            await conn.execute(text("DELETE FROM properties WHERE owner_id = :owner_id"), {"owner_id": owner_id})
+            await conn.execute(text("DELETE FROM users WHERE id = :owner_id"), {"owner_id": owner_id})
+
+    await engine.dispose()
+
+
+asyncio.run(main())
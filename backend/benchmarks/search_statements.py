@@ -0,0 +1,89 @@
+"""
+Microbenchmark: request-path CPU spent turning /properties/search parameters into an
+executable statement, no database or server needed.
+
+  * before -> the statement is built from scratch for every request (what the route did
+              until now); SQLAlchemy then walks the whole tree to compute its cache key
+              before it can reuse the compiled SQL
+  * after  -> the statement comes from the prebuilt ones keyed by the filter signature
+              (app.routes.properties._search_statement); its cache key is memoized, so
+              only the bind values are new per request
+
+Both paths include parsing the filters into a signature + params dict.
+
+Usage (from backend/):
+    python benchmarks/search_statements.py --requests 2000
+"""
+import argparse
+import inspect
+import os
+import sys
+import time
+
+from dotenv import load_dotenv
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+load_dotenv()
+
+from fastapi.params import Query  # noqa: E402
+
+from app.core.pagination import keyset_params  # noqa: E402
+from app.core.filters import search_filters  # noqa: E402
+from app.routes.properties import _search_statement  # noqa: E402
+
+FIELDS = ("id", "title", "city", "price", "currency", "area_sqm")
+
+# typical request shapes: (filters, sort, paginated with a cursor)
+SHAPES = {
+    "city + price range": ({"city": "tbil", "min_price": 100.0, "max_price": 5000.0}, "price_asc", False),
+    "rent, 2 rooms, balcony": ({"transaction_type": "rent", "rooms": 2, "has_balcony": True}, "newest", True),
+    "USD price + area": ({"currency": "USD", "min_price": 10.0, "min_area": 30.0}, "area_desc", False),
+    "near, 5 km": ({"near": "41.71,44.76", "radius_km": 5.0}, "newest", True),
+    "full text": ({"q": "vake apartment"}, "relevance", False),
+}
+
+
+def _filters(values: dict):
+    # call the dependency directly: every omitted Query(...) argument takes its default
+    kwargs = {}
+    for name, param in inspect.signature(search_filters).parameters.items():
+        default = param.default.default if isinstance(param.default, Query) else param.default
+        kwargs[name] = values.get(name, default)
+    return search_filters(**kwargs)
+
+
+def _request(build, values: dict, sort: str, with_cursor: bool):
+    filters = _filters(values)
+    stmt, key_types = build(filters.signature, sort, FIELDS, with_cursor, True)
+    cursor = None
+    if with_cursor:
+        cursor = "WzEyMzRd" if len(key_types) == 1 else "WzEuNSwxMjM0XQ"  # [1234] / [1.5, 1234]
+    params = {"owner_id": 1, **filters.params, **keyset_params(cursor, key_types, 20)}
+    stmt._generate_cache_key()  # done by Session.execute before the compiled-SQL lookup
+    return stmt, params
+
+
+def _us_per_request(build, shape, requests: int) -> float:
+    values, sort, with_cursor = shape
+    t0 = time.process_time()
+    for _ in range(requests):
+        _request(build, values, sort, with_cursor)
+    return (time.process_time() - t0) / requests * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    fresh = _search_statement.__wrapped__
+
+    print(f"{'request shape':<26} {'before us':>10} {'after us':>10} {'speedup':>8}")
+    for name, shape in SHAPES.items():
+        _request(_search_statement, *shape)  # warm the statement cache
+        before = _us_per_request(fresh, shape, args.requests)
+        after = _us_per_request(_search_statement, shape, args.requests)
+        print(f"{name:<26} {before:>10.0f} {after:>10.0f} {before / after:>7.1f}x")
+
+
+main()
@@ -0,0 +1,109 @@
+"""
+Microbenchmark: serializing a 10k-row property list, no database or server needed.
+
+  * before -> ORM Property objects through response_model=list[PropertyResponse]
+              (per-row model_validate, jsonable_encoder, JSONResponse.render)
+  * after  -> plain column tuples through app.core.serialize.RowEncoder
+              (orjson when installed, otherwise the stdlib encoder)
+
+Both outputs are checked to be byte-identical before timing.
+
+Usage (from backend/):
+    python benchmarks/serialize_properties.py --rows 10000 --repeat 5
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+from dotenv import load_dotenv
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+load_dotenv()
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+
+from app.core import serialize  # noqa: E402
+from app.core.serialize import RowEncoder  # noqa: E402
+from app.models.property import Property  # noqa: E402
+from app.schemas.property import PropertyResponse  # noqa: E402
+
+
+def _fake_row(i: int) -> dict:
+    rnd = random.Random(i)
+    price = round(rnd.uniform(300, 900_000), 2)
+    area = round(rnd.uniform(20, 250), 1)
+    return {
+        "id": i,
+        "title": f"Listing {i} ბინა ვაკეში",
+        "transaction_type": rnd.choice(["buy", "rent", "daily_rent"]),
+        "city": rnd.choice(["Tbilisi", "Batumi", "Kutaisi"]),
+        "district": f"District {i % 40}",
+        "street": f"Street {i % 700}",
+        "lat": round(rnd.uniform(41.0, 43.6), 6),
+        "lon": round(rnd.uniform(40.0, 46.7), 6),
+        "currency": rnd.choice(["GEL", "USD", None]),
+        "price": price,
+        "area_sqm": area,
+        "price_per_sqm": price / area,
+        "rooms": rnd.randint(1, 6),
+        "bedrooms": rnd.randint(0, 4),
+        "bathrooms": rnd.randint(1, 3),
+        "floor": rnd.randint(1, 20),
+        "total_floors": 20,
+        "not_first_floor": rnd.random() < 0.5,
+        "condition": rnd.choice(["white_frame", "new_renov", None]),
+        "building_type": "new_building",
+        "heating_type": "central",
+        "has_air_conditioning": rnd.random() < 0.5,
+        "parking_type": None,
+        "has_balcony": rnd.random() < 0.5,
+        "pets_allowed": None,
+        "furnished": "full",
+        "description": "Sunny flat with a view. " * 3,
+        "owner_id": 1,
+    }
+
+
+def _best_ms(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    data = [_fake_row(i) for i in range(args.rows)]
+    encoder = RowEncoder(PropertyResponse)
+    objects = [Property(**d) for d in data]
+    rows = [tuple(d[f] for f in encoder.fields) for d in data]
+
+    def before() -> bytes:
+        return JSONResponse(jsonable_encoder([PropertyResponse.model_validate(o) for o in objects])).body
+
+    def after() -> bytes:
+        return encoder.encode(rows)
+
+    reference = before()
+    if after() != reference:
+        raise SystemExit("fast path output differs from response_model output")
+
+    before_ms = _best_ms(before, args.repeat)
+    after_ms = _best_ms(after, args.repeat)
+    backend = "orjson" if serialize.orjson is not None else "stdlib json"
+
+    print(f"{args.rows} rows, {len(reference) / 1024:.0f} KiB, best of {args.repeat}")
+    print(f"{'response_model (before)':<28} {before_ms:>9.1f} ms")
+    print(f"{'RowEncoder / ' + backend:<28} {after_ms:>9.1f} ms  ({before_ms / after_ms:.1f}x)")
+
+
+main()
@@ -0,0 +1,88 @@
+"""
+Round-trip budget check: runs each property endpoint in-process and fails if it
+sends more SQL statements than allowed (counted with app.db.query_counter.QueryCounter).
+
+Needs a migrated database in DATABASE_URL and httpx (pip install httpx):
+    python check_query_counts.py
+"""
+import asyncio
+import json
+import sys
+import uuid
+
+import httpx
+
+from app.db.query_counter import QueryCounter
+from app.db.session import engine, replica_engines
+from app.main import app
+
+# statements per request once the user is in the auth cache
+# (reads: 1 ETag version lookup + 1 data query)
+BUDGET = {
+    "POST /properties": 1,
+    "POST /properties/bulk": 1,
+    "GET /properties": 2,
+    "GET /properties/search": 2,
+    "GET /properties/search/count": 2,
+    "GET /properties/search/exists": 2,
+    "GET /properties/{id}": 2,
+    "PUT /properties/{id}": 1,
+    "PATCH /properties/{id}": 1,
+    "PATCH /properties/batch": 1,
+    "DELETE /properties/batch": 1,
+    "DELETE /properties/{id}": 1,
+}
+
+
+async def main() -> int:
+    failed = 0
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://check") as client:
+        email = f"query-count-{uuid.uuid4().hex[:8]}@example.com"
+        r = await client.post("/auth/register", json={"email": email, "password": "query-count", "full_name": "QC"})
+        r.raise_for_status()
+        headers = {"Authorization": f"Bearer {r.json()['access_token']}"}
+        (await client.get("/users/me", headers=headers)).raise_for_status()  # warm the auth cache
+
+        async def call(name: str, method: str, url: str, **kwargs) -> httpx.Response:
+            nonlocal failed
+            with QueryCounter(engine, *replica_engines) as queries:
+                r = await client.request(method, url, headers={**headers, **kwargs.pop("headers", {})}, **kwargs)
+            r.raise_for_status()
+            ok = queries.count <= BUDGET[name]
+            failed += not ok
+            print(f"{'ok  ' if ok else 'FAIL'} {name:<30} {queries.count} / {BUDGET[name]}")
+            if not ok:
+                for statement in queries.statements:
+                    print("       " + " ".join(statement.split())[:160])
+            return r
+
+        body = {"title": "Query count", "city": "Tbilisi", "price": 1000, "currency": "GEL", "area_sqm": 50}
+        pid = (await call("POST /properties", "POST", "/properties", json=body)).json()["id"]
+        other = (await client.post("/properties", json=body, headers=headers)).json()["id"]
+
+        # optional cells left blank in a different pattern on every row: still one INSERT per batch
+        optional = {"rooms": 2, "bedrooms": 1, "floor": 3, "district": "Vake", "street": "Chavchavadze"}
+        rows = [{**body, **{k: v for j, (k, v) in enumerate(optional.items()) if i >> j & 1}} for i in range(32)]
+        r = await call(
+            "POST /properties/bulk", "POST", "/properties/bulk",
+            content="".join(json.dumps(row) + "\n" for row in rows),
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+        assert r.json()["inserted"] == len(rows), r.text
+
+        await call("GET /properties", "GET", "/properties?limit=10")
+        await call("GET /properties/search", "GET", "/properties/search?city=tbil&sort=price_asc&limit=10")
+        await call("GET /properties/search/count", "GET", "/properties/search/count?city=tbil")
+        await call("GET /properties/search/exists", "GET", "/properties/search/exists?city=tbil")
+        await call("GET /properties/{id}", "GET", f"/properties/{pid}")
+        await call("PUT /properties/{id}", "PUT", f"/properties/{pid}", json={**body, "price": 1100})
+        await call("PATCH /properties/{id}", "PATCH", f"/properties/{pid}", json={"price": 1200})
+        await call("PATCH /properties/batch", "PATCH", "/properties/batch", json={"ids": [pid, other], "changes": {"rooms": 2}})
+        await call("DELETE /properties/batch", "DELETE", "/properties/batch", json={"ids": [other]})
+        await call("DELETE /properties/{id}", "DELETE", f"/properties/{pid}")
+
+    return 1 if failed else 0
+
+
+sys.exit(asyncio.run(main()))
@@ -0,0 +1,43 @@
+"""
+Load exchange rates from a local file and re-normalize every Property.price_base.
+
+    python load_exchange_rates.py rates.csv     # header: currency,rate_to_base
+    python load_exchange_rates.py rates.json    # {"USD": 2.71, "EUR": 2.93}
+
+rate_to_base = how many BASE_CURRENCY units one unit of `currency` is worth.
+"""
+import asyncio
+import csv
+import json
+import sys
+from pathlib import Path
+
+from app.core.config import BASE_CURRENCY
+from app.core.fx import recompute_price_base, upsert_rates
+from app.db.session import AsyncSessionLocal, engine
+
+
+def read_rates(path: Path) -> dict[str, float]:
+    if path.suffix.lower() == ".json":
+        return {c: float(r) for c, r in json.loads(path.read_text(encoding="utf-8")).items()}
+
+    with path.open(newline="", encoding="utf-8-sig") as f:
+        return {row["currency"].strip(): float(row["rate_to_base"]) for row in csv.DictReader(f)}
+
+
+async def main():
+    if len(sys.argv) != 2:
+        raise SystemExit(__doc__)
+
+    rates = read_rates(Path(sys.argv[1]))
+
+    async with AsyncSessionLocal() as db:
+        await upsert_rates(db, rates)
+        updated = await recompute_price_base(db)
+        await db.commit()
+
+    await engine.dispose()
+    print(f"Loaded {len(rates)} rates (base {BASE_CURRENCY}), re-normalized {updated} properties ✅")
+
+
+asyncio.run(main())